@@ -5,6 +5,7 @@ Provides a hierarchy of custom exceptions for camera operations,
 enabling precise error handling and user-friendly error messages.
 """
 
+import functools
 from typing import Optional
 
 
@@ -71,6 +72,7 @@ def handle_camera_error(func):
     Converts common exceptions into appropriate CameraError subclasses
     with helpful error messages for debugging.
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
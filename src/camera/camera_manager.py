@@ -10,7 +10,7 @@ functionality to specialized modules for better maintainability.
 
 import time
 import threading
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Callable
 
 from src.config import AppConfig
 from .camera_exceptions import (
@@ -79,6 +79,9 @@ class CameraManager:
         self.total_frames_sent = 0
         self.total_frames_dropped = 0
         
+        # Notified after streaming stops or the device is released
+        self._teardown_callback: Optional[Callable[[], None]] = None
+        
         # Lazy initialization for low resource mode
         if not config.low_resource_mode:
             # For normal systems, detect capabilities early
@@ -112,16 +115,16 @@ class CameraManager:
             # Print configuration summary
             self.hardware_detector.print_detection_summary()
             
-            # Create camera instance
-            self.camera_device = Picamera2()
+            # Reuse the instance opened during detection when available
+            self.camera_device = self.hardware_detector.take_camera() or Picamera2()
             
             # Create dual-stream video configuration
             video_config = self.camera_device.create_video_configuration(
-                main=camera_config["main_stream"],
-                lores=camera_config["lores_stream"],
+                main={"size": camera_config.main_size, "format": camera_config.main_format},
+                lores={"size": camera_config.lores_size, "format": camera_config.lores_format},
                 encode="lores",  # Stream the lower resolution
-                buffer_count=camera_config["buffer_count"],
-                transform=camera_config["transform"]
+                buffer_count=camera_config.buffer_count,
+                transform=camera_config.transform
             )
             
             # Configure and start camera
@@ -151,7 +154,7 @@ class CameraManager:
             # Use minimal config helper
             minimal_config = create_minimal_camera_config()
             if self.config.low_resource_mode:
-                minimal_config["buffer_count"] = 1
+                minimal_config["buffer_count"] = 2  # Double buffering avoids tearing on Pi Zero 2W
             
             self.camera_device.configure(minimal_config)
             self.camera_device.start()
@@ -268,6 +271,7 @@ class CameraManager:
             # Stop camera recording
             self.camera_device.stop_recording()
             self.is_streaming = False
+            self._notify_teardown()
             
             # Reset adaptive parameters
             self.quality_adapter.reset_to_maximum_quality()
@@ -422,6 +426,14 @@ class CameraManager:
         network_condition = "slow" if metrics.get("network_slow", False) else "stable"
         self.streaming_stats.record_network_condition(network_condition)
     
+    def set_teardown_callback(self, callback: Callable[[], None]):
+        """Set callback invoked after streaming stops or the camera is released"""
+        self._teardown_callback = callback
+    
+    def _notify_teardown(self):
+        if self._teardown_callback:
+            self._teardown_callback()
+    
     def cleanup(self):
         """Clean up camera resources and stop all components"""
         try:
@@ -433,12 +445,16 @@ class CameraManager:
             if self.network_monitor:
                 self.network_monitor.stop_monitoring()
             
+            # Close any detection instance that was never handed off
+            self.hardware_detector.release_camera()
+            
             # Close camera device
             if self.camera_device:
                 self.camera_device.stop()
                 self.camera_device.close()
                 self.camera_device = None
                 print("🔒 Camera resources released")
+            self._notify_teardown()
             
             # Reset statistics
             if self.streaming_stats:
@@ -5,28 +5,90 @@ Handles automatic detection of Raspberry Pi camera modules,
 capability assessment, and configuration optimization based on hardware.
 """
 
+import functools
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional, Tuple, Dict, Any
 from src.config import AppConfig
 from .camera_exceptions import HardwareDetectionError, handle_camera_error
 
+logger = logging.getLogger(__name__)
+
 # Import picamera2 - graceful handling for development environments
 try:
     from picamera2 import Picamera2 # type: ignore
     from libcamera import Transform # type: ignore
     PICAMERA2_AVAILABLE = True
-    print("✅ Picamera2 imported successfully")
+    logger.info("✅ Picamera2 imported successfully")
 except ImportError as e:
-    print(f"⚠️  Picamera2 not available: {e}")
+    logger.warning("⚠️  Picamera2 not available: %s", e)
     PICAMERA2_AVAILABLE = False
-    # Mock classes for development
+    # Stand-ins so annotations resolve; callers must check PICAMERA2_AVAILABLE first
     class Picamera2:
-        def __init__(self): pass
-        @property
-        def sensor_resolution(self): return (1920, 1080)
-        def close(self): pass
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("Picamera2 is not available")
     
     class Transform:
-        def __init__(self, **kwargs): pass
+        def __init__(self, **kwargs):
+            raise RuntimeError("libcamera is not available")
+
+
+# Module classification by sensor pixel count, sorted descending:
+# (min_pixels, module_name, low_resource_buffers, normal_buffers)
+_MODULE_TABLE = (
+    (12_000_000, "Camera Module 3", 2, 2),      # 12MP+
+    (8_000_000, "Camera Module 2", 2, 3),       # 8MP+
+    (5_000_000, "Camera Module 1 v2", 2, 2),    # 5MP+
+)
+
+# Camera config checks, evaluated in order until the first failure: (check, message)
+_CONFIG_VALIDATORS = (
+    (lambda c: isinstance(c.main_size, (tuple, list)) and len(c.main_size) == 2,
+     "Invalid main stream size format"),
+    (lambda c: isinstance(c.lores_size, (tuple, list)) and len(c.lores_size) == 2,
+     "Invalid lores stream size format"),
+    (lambda c: c.main_size[0] >= 320 and c.main_size[1] >= 240,
+     "Main stream resolution too small"),
+    (lambda c: c.lores_size[0] >= 160 and c.lores_size[1] >= 120,
+     "Lores stream resolution too small"),
+    (lambda c: isinstance(c.buffer_count, int) and 1 <= c.buffer_count <= 10,
+     "Invalid buffer count (must be 1-10)"),
+)
+
+# Minimal but functional picamera2 configuration for fallback scenarios
+_MINIMAL_CAMERA_CONFIG = MappingProxyType({
+    "main": MappingProxyType({"size": (1920, 1080), "format": "RGB888"}),
+    "lores": MappingProxyType({"size": (640, 480)}),
+    "encode": "lores",
+    "buffer_count": 1
+})
+
+# Approximate bytes per pixel for supported stream formats
+_BYTES_PER_PIXEL = {
+    "RGB888": 3,
+    "BGR888": 3,
+    "XRGB8888": 4,
+    "XBGR8888": 4,
+    "YUV420": 1.5,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _make_transform(hflip: bool, vflip: bool) -> Optional[Any]:
+    """Get a shared libcamera Transform for the given flip flags"""
+    return Transform(hflip=hflip, vflip=vflip) if PICAMERA2_AVAILABLE else None
+
+
+@dataclass(slots=True, frozen=True)
+class CameraConfig:
+    """Optimized dual-stream camera configuration"""
+    main_size: Tuple[int, int]
+    main_format: str
+    lores_size: Tuple[int, int]
+    lores_format: str
+    buffer_count: int
+    transform: Optional[Any] = None
 
 
 class HardwareDetector:
@@ -37,11 +99,28 @@ class HardwareDetector:
     and provides optimized settings for performance and resource usage.
     """
     
+    __slots__ = (
+        "config", "sensor_resolution", "camera_module", "recommended_buffer_count",
+        "_cached_config", "_cached_hardware_info", "_camera"
+    )
+    
     def __init__(self, config: AppConfig):
         self.config = config
         self.sensor_resolution: Optional[Tuple[int, int]] = None
         self.camera_module: str = "unknown"
         self.recommended_buffer_count: int = 2
+        
+        # Derived results are memoized until detection state changes
+        self._cached_config: Optional[CameraConfig] = None
+        self._cached_hardware_info: Optional[Dict[str, Any]] = None
+        
+        # Camera opened during detection, reused by the camera manager
+        self._camera: Optional[Picamera2] = None
+    
+    def _invalidate_cache(self):
+        """Drop memoized configuration after detection state changes"""
+        self._cached_config = None
+        self._cached_hardware_info = None
     
     @handle_camera_error
     def detect_camera_capabilities(self) -> bool:
@@ -55,29 +134,66 @@ class HardwareDetector:
             HardwareDetectionError: If detection fails critically
         """
         if not PICAMERA2_AVAILABLE:
-            print("⚠️  Picamera2 not available - using mock configuration")
+            logger.info("⚠️  Picamera2 not available - using mock configuration")
             self._use_fallback_configuration()
             return False
         
+        self.release_camera()
+        
         try:
-            # Temporary camera instance for detection
-            temp_camera = Picamera2()
-            self.sensor_resolution = temp_camera.sensor_resolution
-            temp_camera.close()
+            # Detection instance is kept open for handoff to the camera manager
+            self._camera = Picamera2()
+            self.sensor_resolution = self._camera.sensor_resolution
             
             # Detect module type based on resolution
             self._classify_camera_module()
             
-            print(f"📷 {self.camera_module} detected: {self.sensor_resolution[0]}x{self.sensor_resolution[1]}")
+            logger.info("📷 %s detected: %dx%d", self.camera_module,
+                        self.sensor_resolution[0], self.sensor_resolution[1])
             return True
             
         except Exception as e:
-            print(f"⚠️  Camera detection failed: {e}")
+            logger.warning("⚠️  Camera detection failed: %s", e)
+            self.release_camera()
             self._use_fallback_configuration()
             return False
     
+    def take_camera(self) -> Optional[Picamera2]:
+        """
+        Hand off the camera instance opened during detection
+        
+        Returns:
+            The open Picamera2 instance, or None if none is held
+        """
+        camera, self._camera = self._camera, None
+        return camera
+    
+    def release_camera(self):
+        """Close the detection camera instance if it was never handed off"""
+        camera, self._camera = self._camera, None
+        if camera is not None:
+            try:
+                camera.close()
+            except Exception as e:
+                logger.warning("⚠️  Error closing detection camera: %s", e)
+    
+    def reset_detection(self):
+        """Forget detection results so the next initialization starts clean"""
+        self.release_camera()
+        self.sensor_resolution = None
+        self.camera_module = "unknown"
+        self._invalidate_cache()
+    
     def _classify_camera_module(self):
-        """Classify camera module based on sensor resolution"""
+        """
+        Classify camera module based on sensor resolution
+        
+        Every module gets at least two buffers, including in low resource
+        mode: with a single buffer each frame must be fully processed before
+        the next one arrives, which tears and drops frames.
+        """
+        self._invalidate_cache()
+        
         if not self.sensor_resolution:
             self.camera_module = "unknown"
             self.recommended_buffer_count = 2
@@ -86,21 +202,20 @@ class HardwareDetector:
         width, height = self.sensor_resolution
         total_pixels = width * height
         
-        if total_pixels >= 12000000:  # 12MP+ (Module 3)
-            self.camera_module = "Camera Module 3"
-            self.recommended_buffer_count = 2 if self.config.low_resource_mode else 2
-        elif total_pixels >= 8000000:  # 8MP+ (Module 2)
-            self.camera_module = "Camera Module 2"
-            self.recommended_buffer_count = 2 if self.config.low_resource_mode else 3
-        elif total_pixels >= 5000000:  # 5MP+ (Module 1 v2)
-            self.camera_module = "Camera Module 1 v2"
-            self.recommended_buffer_count = 2
-        else:
-            self.camera_module = "Camera Module (other)"
-            self.recommended_buffer_count = 2
+        for threshold, name, low_resource_buffers, normal_buffers in _MODULE_TABLE:
+            if total_pixels >= threshold:
+                self.camera_module = name
+                self.recommended_buffer_count = (
+                    low_resource_buffers if self.config.low_resource_mode else normal_buffers
+                )
+                return
+        
+        self.camera_module = "Camera Module (other)"
+        self.recommended_buffer_count = 2
     
     def _use_fallback_configuration(self):
         """Use fallback configuration when detection fails"""
+        self._invalidate_cache()
         self.sensor_resolution = (
             self.config.camera_fallback_width,
             self.config.camera_fallback_height
@@ -108,13 +223,16 @@ class HardwareDetector:
         self.camera_module = "fallback"
         self.recommended_buffer_count = 2
     
-    def get_optimal_camera_config(self) -> Dict[str, Any]:
+    def get_optimal_camera_config(self) -> CameraConfig:
         """
         Get camera configuration optimized for detected module and resource mode
         
         Returns:
-            Dict containing optimized camera configuration
+            CameraConfig containing optimized camera configuration
         """
+        if self._cached_config is not None:
+            return self._cached_config
+        
         # Main stream - full resolution for photo capture
         if self.config.camera_auto_detect and self.sensor_resolution:
             main_size = self.sensor_resolution
@@ -129,7 +247,7 @@ class HardwareDetector:
         
         # Camera buffer count optimization
         if self.config.low_resource_mode:
-            buffer_count = 1  # Single buffer for Pi Zero 2W
+            buffer_count = 2  # Double buffering avoids tearing on Pi Zero 2W
         elif self.config.buffer_count_auto:
             buffer_count = self.recommended_buffer_count
         else:
@@ -144,21 +262,46 @@ class HardwareDetector:
             main_format = self.config.main_stream_format
             lores_format = self.config.lores_stream_format
         
-        return {
-            "main_stream": {
-                "size": main_size,
-                "format": main_format
-            },
-            "lores_stream": {
-                "size": lores_size,
-                "format": lores_format
-            },
-            "buffer_count": buffer_count,
-            "transform": Transform(
-                hflip=self.config.camera_hflip,
-                vflip=self.config.camera_vflip
-            ) if PICAMERA2_AVAILABLE else None
-        }
+        # Pre-allocate as many buffers as the memory budget allows
+        requested_buffers = buffer_count
+        while buffer_count > 1 and not self._memory_budget_ok(
+            main_size, main_format, lores_size, lores_format, buffer_count
+        ):
+            buffer_count -= 1
+        if buffer_count < requested_buffers:
+            logger.warning("⚠️  Buffer count lowered from %d to %d to fit the %d MB camera memory budget",
+                           requested_buffers, buffer_count, self.config.max_camera_memory_mb)
+        
+        self._cached_config = CameraConfig(
+            main_size=main_size,
+            main_format=main_format,
+            lores_size=lores_size,
+            lores_format=lores_format,
+            buffer_count=buffer_count,
+            transform=_make_transform(self.config.camera_hflip, self.config.camera_vflip)
+        )
+        return self._cached_config
+    
+    def _memory_budget_ok(self, main_size: Tuple[int, int], main_format: str,
+                          lores_size: Tuple[int, int], lores_format: str,
+                          buffer_count: int) -> bool:
+        """
+        Check whether the requested camera buffers fit the memory budget
+        
+        Args:
+            main_size: Main stream resolution
+            main_format: Main stream pixel format
+            lores_size: Lores stream resolution
+            lores_format: Lores stream pixel format
+            buffer_count: Number of buffers per stream
+            
+        Returns:
+            bool: True if the buffers fit within max_camera_memory_mb
+        """
+        main_bytes = main_size[0] * main_size[1] * _BYTES_PER_PIXEL.get(main_format, 4)
+        lores_bytes = lores_size[0] * lores_size[1] * _BYTES_PER_PIXEL.get(lores_format, 4)
+        total_bytes = (main_bytes + lores_bytes) * buffer_count
+        return total_bytes <= self.config.max_camera_memory_mb * 1024 * 1024
     
     def get_hardware_info(self) -> Dict[str, Any]:
         """
@@ -167,7 +310,10 @@ class HardwareDetector:
         Returns:
             Dict containing hardware detection results
         """
-        return {
+        if self._cached_hardware_info is not None:
+            return self._cached_hardware_info
+        
+        self._cached_hardware_info = {
             "sensor_resolution": self.sensor_resolution,
             "camera_module": self.camera_module,
             "recommended_buffer_count": self.recommended_buffer_count,
@@ -175,18 +321,22 @@ class HardwareDetector:
             "low_resource_mode": self.config.low_resource_mode,
             "detection_successful": self.sensor_resolution is not None and self.camera_module != "fallback"
         }
+        return self._cached_hardware_info
     
     def print_detection_summary(self):
-        """Print a summary of hardware detection results"""
+        """Log a summary of hardware detection results"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         config = self.get_optimal_camera_config()
         
-        print("📋 Hardware Detection Summary:")
-        print(f"   📷 Camera: {self.camera_module}")
-        print(f"   📐 Main stream: {config['main_stream']['size']} ({config['main_stream']['format']})")
-        print(f"   📺 Lores stream: {config['lores_stream']['size']} ({config['lores_stream']['format']})")
-        print(f"   🧠 Buffer count: {config['buffer_count']}")
-        print(f"   ⚡ Low resource mode: {self.config.low_resource_mode}")
-        print(f"   🔄 Transform: HFlip={self.config.camera_hflip}, VFlip={self.config.camera_vflip}")
+        logger.info("📋 Hardware Detection Summary:")
+        logger.info("   📷 Camera: %s", self.camera_module)
+        logger.info("   📐 Main stream: %s (%s)", config.main_size, config.main_format)
+        logger.info("   📺 Lores stream: %s (%s)", config.lores_size, config.lores_format)
+        logger.info("   🧠 Buffer count: %d", config.buffer_count)
+        logger.info("   ⚡ Low resource mode: %s", self.config.low_resource_mode)
+        logger.info("   🔄 Transform: HFlip=%s, VFlip=%s", self.config.camera_hflip, self.config.camera_vflip)
 
 
 def create_minimal_camera_config() -> Dict[str, Any]:
@@ -195,62 +345,35 @@ def create_minimal_camera_config() -> Dict[str, Any]:
     
     Returns:
         Dict containing minimal but functional camera configuration
+        (a fresh copy of _MINIMAL_CAMERA_CONFIG that callers may mutate)
     """
     return {
-        "main": {"size": (1920, 1080), "format": "RGB888"},
-        "lores": {"size": (640, 480)},
-        "encode": "lores",
-        "buffer_count": 1
+        key: dict(value) if isinstance(value, MappingProxyType) else value
+        for key, value in _MINIMAL_CAMERA_CONFIG.items()
     }
 
 
-def validate_camera_config(config: Dict[str, Any]) -> bool:
+def validate_camera_config(config: CameraConfig) -> bool:
     """
     Validate camera configuration for common issues
     
     Args:
-        config: Camera configuration dictionary
+        config: Camera configuration
         
     Returns:
         bool: True if configuration is valid
     """
     try:
-        # Check required keys
-        required_keys = ["main_stream", "lores_stream", "buffer_count"]
-        for key in required_keys:
-            if key not in config:
-                print(f"⚠️  Missing required configuration key: {key}")
-                return False
-        
-        # Check resolution formats
-        main_size = config["main_stream"]["size"]
-        lores_size = config["lores_stream"]["size"]
-        
-        if not isinstance(main_size, tuple) or len(main_size) != 2:
-            print("⚠️  Invalid main stream size format")
-            return False
-        
-        if not isinstance(lores_size, tuple) or len(lores_size) != 2:
-            print("⚠️  Invalid lores stream size format")
-            return False
-        
-        # Check reasonable dimensions
-        if main_size[0] < 320 or main_size[1] < 240:
-            print("⚠️  Main stream resolution too small")
-            return False
-        
-        if lores_size[0] < 160 or lores_size[1] < 120:
-            print("⚠️  Lores stream resolution too small")
-            return False
-        
-        # Check buffer count
-        buffer_count = config["buffer_count"]
-        if not isinstance(buffer_count, int) or buffer_count < 1 or buffer_count > 10:
-            print("⚠️  Invalid buffer count (must be 1-10)")
-            return False
-        
-        return True
-        
+        error = next(
+            (message for check, message in _CONFIG_VALIDATORS if not check(config)),
+            None
+        )
     except Exception as e:
-        print(f"⚠️  Configuration validation error: {e}")
+        logger.warning("⚠️  Configuration validation error: %s", e)
         return False
+    
+    if error is not None:
+        logger.warning("⚠️  %s", error)
+        return False
+    
+    return True
@@ -5,12 +5,90 @@ Provides comprehensive health monitoring, diagnostics, and recovery
 endpoints for system health management without a dashboard UI.
 """
 
+import asyncio
+import logging
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, Optional
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 
-from fastapi import HTTPException
+import orjson
+from fastapi import HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from src.config import AppConfig
 
+logger = logging.getLogger(__name__)
+
+# Component status categories used by the health summary
+_HEALTHY_STATUSES = frozenset({"healthy", "success"})
+_WARNING_STATUSES = frozenset({"warning", "degraded"})
+_CRITICAL_STATUSES = frozenset({"critical", "error", "failed"})
+
+# Problem types accepted by trigger_recovery
+_VALID_RECOVERY_TYPES = frozenset({
+    "camera_availability", "hardware_timeout", "frame_generation",
+    "stream_quality", "session_management", "streaming_performance"
+})
+
+# Pre-bound clock used for response timestamps
+_now = datetime.now
+
+# Components reported by get_health_detailed: (name, attribute, health method, label)
+_HEALTH_COMPONENTS = (
+    ("health_monitor", "health_monitor", "get_health_status", "Health monitor"),
+    ("camera", "camera_manager", "get_status", "Camera manager"),
+    ("sessions", "session_manager", "get_session_stats", "Session manager"),
+    ("streaming", "streaming_validator", "validate_stream_health", "Streaming validator"),
+    ("recovery", "recovery_manager", "get_recovery_status", "Recovery manager"),
+)
+
+# How long comprehensive diagnostics are reused before components are re-queried (seconds)
+_DIAGNOSTICS_CACHE_TTL = 2.0
+
+
+def request_timestamp() -> datetime:
+    """
+    Timestamp computed once per request (usable as a FastAPI dependency)
+    
+    Returned as a datetime; the ORJSON response class serializes it to ISO 8601.
+    """
+    return _now()
+
+
+def _compute_etag(content: Any) -> str:
+    """Compute a strong ETag for JSON-compatible content"""
+    digest = blake2b(orjson.dumps(content, option=orjson.OPT_SORT_KEYS), digest_size=8)
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag"""
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def _gather_component_calls(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run blocking component queries concurrently in worker threads
+    
+    Args:
+        calls: Mapping of result name to zero-argument component method
+        
+    Returns:
+        Dict of results by name; failed calls map to {"error": message}
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(fn) for fn in calls.values()),
+        return_exceptions=True
+    )
+    return {
+        name: {"error": str(res)} if isinstance(res, Exception) else res
+        for name, res in zip(calls, results)
+    }
+
 
 class HealthAPI:
     """
@@ -23,6 +101,12 @@ class HealthAPI:
     - Performance monitoring endpoints
     """
     
+    __slots__ = (
+        "config", "health_monitor", "session_manager", "recovery_manager",
+        "streaming_validator", "camera_manager", "_component_calls", "_system_info_cache",
+        "_diag_cache"
+    )
+    
     def __init__(self, config: AppConfig):
         self.config = config
         
@@ -33,7 +117,16 @@ class HealthAPI:
         self.streaming_validator = None
         self.camera_manager = None
         
-        print("🔗 HealthAPI initialized")
+        # Health query per available component, built by set_component_references
+        self._component_calls: Dict[str, Callable[[], Any]] = {}
+        
+        # Read-only system info, rebuilt by set_component_references
+        self._system_info_cache = self._build_system_info()
+        
+        # Cached comprehensive diagnostics: (expires_at, etag, content)
+        self._diag_cache: Optional[Tuple[float, str, Dict[str, Any]]] = None
+        
+        logger.info("🔗 HealthAPI initialized")
     
     def set_component_references(self, health_monitor=None, session_manager=None, 
                                recovery_manager=None, streaming_validator=None, camera_manager=None):
@@ -48,54 +141,35 @@ class HealthAPI:
             self.streaming_validator = streaming_validator
         if camera_manager:
             self.camera_manager = camera_manager
+        
+        self._component_calls = {
+            name: getattr(component, method)
+            for name, attr, method, _ in _HEALTH_COMPONENTS
+            if (component := getattr(self, attr)) is not None
+        }
+        self._system_info_cache = self._build_system_info()
     
     # Main Health Endpoints
     
-    def get_health_detailed(self) -> Dict[str, Any]:
+    async def get_health_detailed(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Get comprehensive system health status"""
         try:
             result = {
                 "overall_status": "unknown",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or _now(),
                 "components": {},
                 "summary": {}
             }
             
-            # Health Monitor Status
-            if self.health_monitor:
-                health_status = self.health_monitor.get_health_status()
-                result["overall_status"] = health_status.get("overall_status", "unknown")
-                result["components"]["health_monitor"] = health_status
-            else:
-                result["components"]["health_monitor"] = {"error": "Health monitor not available"}
+            # Registered components are queried concurrently
+            responses = await _gather_component_calls(self._component_calls)
             
-            # Camera Health
-            if self.camera_manager:
-                camera_status = self.camera_manager.get_status()
-                result["components"]["camera"] = camera_status
-            else:
-                result["components"]["camera"] = {"error": "Camera manager not available"}
-            
-            # Session Management Health
-            if self.session_manager:
-                session_stats = self.session_manager.get_session_stats()
-                result["components"]["sessions"] = session_stats
-            else:
-                result["components"]["sessions"] = {"error": "Session manager not available"}
+            for name, _, _, label in _HEALTH_COMPONENTS:
+                result["components"][name] = responses.get(name, {"error": f"{label} not available"})
             
-            # Streaming Health
-            if self.streaming_validator:
-                streaming_health = self.streaming_validator.validate_stream_health()
-                result["components"]["streaming"] = streaming_health
-            else:
-                result["components"]["streaming"] = {"error": "Streaming validator not available"}
-            
-            # Recovery Manager Status
-            if self.recovery_manager:
-                recovery_status = self.recovery_manager.get_recovery_status()
-                result["components"]["recovery"] = recovery_status
-            else:
-                result["components"]["recovery"] = {"error": "Recovery manager not available"}
+            health_status = result["components"]["health_monitor"]
+            if "error" not in health_status:
+                result["overall_status"] = health_status.get("overall_status", "unknown")
             
             # Generate summary
             result["summary"] = self._generate_health_summary(result["components"])
@@ -105,7 +179,7 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
     
-    def get_health_camera(self) -> Dict[str, Any]:
+    def get_health_camera(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Get camera-specific health information"""
         try:
             if not self.camera_manager:
@@ -142,7 +216,7 @@ class HealthAPI:
                 "photo_stats": photo_stats,
                 "streaming_stats": streaming_stats,
                 "health_metrics": camera_health,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
@@ -150,11 +224,11 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Camera health check failed: {str(e)}")
     
-    def get_health_streaming(self) -> Dict[str, Any]:
+    def get_health_streaming(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Get streaming-specific health and performance information"""
         try:
             result = {
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
             # Streaming validator health
@@ -183,7 +257,7 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Streaming health check failed: {str(e)}")
     
-    def get_health_sessions(self) -> Dict[str, Any]:
+    def get_health_sessions(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Get session management health information"""
         try:
             if not self.session_manager:
@@ -192,17 +266,17 @@ class HealthAPI:
             # Session statistics
             session_stats = self.session_manager.get_session_stats()
             
-            # Active sessions (limited info for security)
-            active_sessions = self.session_manager.get_active_sessions()
+            # Active session count (no per-session info for security)
+            active_sessions_count = self.session_manager.get_active_session_count()
             
             # Security status
             security_status = self.session_manager.get_security_status()
             
             return {
                 "session_stats": session_stats,
-                "active_sessions_count": len(active_sessions),
+                "active_sessions_count": active_sessions_count,
                 "security_status": security_status,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
@@ -210,7 +284,7 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Session health check failed: {str(e)}")
     
-    def get_health_recovery(self) -> Dict[str, Any]:
+    def get_health_recovery(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Get recovery system status and history"""
         try:
             if not self.recovery_manager:
@@ -225,7 +299,7 @@ class HealthAPI:
             return {
                 "recovery_status": recovery_status,
                 "recent_recovery_history": recovery_history,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
@@ -235,42 +309,75 @@ class HealthAPI:
     
     # Diagnostic Endpoints
     
-    def get_diagnostics_comprehensive(self) -> Dict[str, Any]:
-        """Get comprehensive system diagnostics"""
+    async def get_diagnostics_comprehensive(self, timestamp: Optional[datetime] = None,
+                                            if_none_match: Optional[str] = None) -> Response:
+        """
+        Get comprehensive system diagnostics
+        
+        Results are reused for a short TTL and tagged with an ETag; a request
+        whose If-None-Match matches gets 304 Not Modified without a body.
+        """
         try:
-            diagnostics = {
-                "timestamp": datetime.now().isoformat(),
-                "system_info": self._get_system_info(),
-                "components": {}
-            }
-            
-            # Health monitor diagnostics
-            if self.health_monitor:
-                diagnostics["components"]["health_monitor"] = self.health_monitor.get_detailed_diagnostics()
-            
-            # Streaming validator diagnostics
-            if self.streaming_validator:
-                quality_validation = self.streaming_validator.validate_stream_quality()
-                diagnostics["components"]["streaming_validator"] = quality_validation
-            
-            # Camera diagnostics
-            if self.camera_manager:
-                diagnostics["components"]["camera"] = {
-                    "status": self.camera_manager.get_status(),
-                    "hardware_info": self.camera_manager.get_hardware_info(),
-                    "network_status": self.camera_manager.get_network_status()
-                }
-            
-            return diagnostics
+            now = time.monotonic()
+            cache = self._diag_cache
+            if cache is None or now >= cache[0]:
+                diagnostics = jsonable_encoder(await self._collect_diagnostics(timestamp))
+                etag = _compute_etag({k: v for k, v in diagnostics.items() if k != "timestamp"})
+                cache = self._diag_cache = (now + _DIAGNOSTICS_CACHE_TTL, etag, diagnostics)
+            
+            _, etag, diagnostics = cache
+            headers = {"ETag": etag}
+            if if_none_match and _etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=headers)
+            return ORJSONResponse(diagnostics, headers=headers)
             
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Comprehensive diagnostics failed: {str(e)}")
     
-    def get_diagnostics_performance(self) -> Dict[str, Any]:
+    async def _collect_diagnostics(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
+        """Query all components for comprehensive diagnostics"""
+        diagnostics = {
+            "timestamp": timestamp or _now(),
+            "system_info": self._get_system_info(),
+            "components": {}
+        }
+        
+        calls = {}
+        
+        # Health monitor diagnostics
+        if self.health_monitor:
+            calls["health_monitor"] = self.health_monitor.get_detailed_diagnostics
+        
+        # Streaming validator diagnostics
+        if self.streaming_validator:
+            calls["streaming_validator"] = self.streaming_validator.validate_stream_quality
+        
+        # Camera diagnostics
+        if self.camera_manager:
+            calls["camera_status"] = self.camera_manager.get_status
+            calls["camera_hardware_info"] = self.camera_manager.get_hardware_info
+            calls["camera_network_status"] = self.camera_manager.get_network_status
+        
+        responses = await _gather_component_calls(calls)
+        
+        for name in ("health_monitor", "streaming_validator"):
+            if name in responses:
+                diagnostics["components"][name] = responses[name]
+        
+        if self.camera_manager:
+            diagnostics["components"]["camera"] = {
+                "status": responses["camera_status"],
+                "hardware_info": responses["camera_hardware_info"],
+                "network_status": responses["camera_network_status"]
+            }
+        
+        return diagnostics
+
+    def get_diagnostics_performance(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Get performance-specific diagnostics"""
         try:
             performance = {
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
             # Streaming performance
@@ -295,7 +402,7 @@ class HealthAPI:
     
     # Recovery Control Endpoints
     
-    def force_health_check(self) -> Dict[str, Any]:
+    def force_health_check(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Force an immediate comprehensive health check"""
         try:
             if not self.health_monitor:
@@ -306,7 +413,7 @@ class HealthAPI:
             return {
                 "message": "Forced health check completed",
                 "health_status": health_status,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
@@ -314,20 +421,18 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Forced health check failed: {str(e)}")
     
-    def trigger_recovery(self, problem_type: str) -> Dict[str, Any]:
+    def trigger_recovery(self, problem_type: str, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Trigger recovery for a specific problem type"""
         try:
             if not self.recovery_manager:
                 raise HTTPException(status_code=503, detail="Recovery manager not available")
             
             # Validate problem type
-            valid_types = [
-                "camera_availability", "hardware_timeout", "frame_generation",
-                "stream_quality", "session_management", "streaming_performance"
-            ]
-            
-            if problem_type not in valid_types:
-                raise HTTPException(status_code=400, detail=f"Invalid problem type. Valid types: {valid_types}")
+            if problem_type not in _VALID_RECOVERY_TYPES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid problem type. Valid types: {sorted(_VALID_RECOVERY_TYPES)}"
+                )
             
             success = self.recovery_manager.force_recovery(problem_type)
             
@@ -335,7 +440,7 @@ class HealthAPI:
                 "message": f"Recovery {'successful' if success else 'failed'} for {problem_type}",
                 "problem_type": problem_type,
                 "success": success,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
@@ -343,10 +448,11 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Recovery trigger failed: {str(e)}")
     
-    def reset_system_state(self) -> Dict[str, Any]:
+    def reset_system_state(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Reset all system monitoring and recovery state"""
         try:
             reset_results = {}
+            self._diag_cache = None
             
             # Reset health monitor
             if self.health_monitor:
@@ -371,7 +477,7 @@ class HealthAPI:
             return {
                 "message": "System state reset completed",
                 "reset_results": reset_results,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except Exception as e:
@@ -381,74 +487,79 @@ class HealthAPI:
     
     def _generate_health_summary(self, components: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a summary of component health"""
-        summary = {
-            "healthy_components": 0,
-            "warning_components": 0,
-            "critical_components": 0,
-            "offline_components": 0,
-            "total_components": 0,
-            "overall_assessment": "unknown"
-        }
+        counter = Counter()
         
         for component_name, component_data in components.items():
             if "error" in component_data:
-                summary["offline_components"] += 1
+                counter["offline"] += 1
+                continue
+            
+            # Try to extract status from different component formats
+            status = "unknown"
+            if "overall_status" in component_data:
+                status = component_data["overall_status"]
+            elif "health_status" in component_data:
+                status = component_data["health_status"]
+            elif "status" in component_data:
+                if isinstance(component_data["status"], dict) and "available" in component_data["status"]:
+                    status = "healthy" if component_data["status"]["available"] else "critical"
+            
+            if status in _HEALTHY_STATUSES:
+                counter["healthy"] += 1
+            elif status in _WARNING_STATUSES:
+                counter["warning"] += 1
+            elif status in _CRITICAL_STATUSES:
+                counter["critical"] += 1
             else:
-                # Try to extract status from different component formats
-                status = "unknown"
-                if "overall_status" in component_data:
-                    status = component_data["overall_status"]
-                elif "health_status" in component_data:
-                    status = component_data["health_status"]
-                elif "status" in component_data:
-                    if isinstance(component_data["status"], dict) and "available" in component_data["status"]:
-                        status = "healthy" if component_data["status"]["available"] else "critical"
-                
-                if status in ["healthy", "success"]:
-                    summary["healthy_components"] += 1
-                elif status in ["warning", "degraded"]:
-                    summary["warning_components"] += 1
-                elif status in ["critical", "error", "failed"]:
-                    summary["critical_components"] += 1
-                else:
-                    summary["offline_components"] += 1
-            
-            summary["total_components"] += 1
+                counter["offline"] += 1
+        
+        total = len(components)
         
         # Determine overall assessment
-        if summary["critical_components"] > 0:
-            summary["overall_assessment"] = "critical"
-        elif summary["warning_components"] > 0:
-            summary["overall_assessment"] = "warning"
-        elif summary["healthy_components"] == summary["total_components"]:
-            summary["overall_assessment"] = "healthy"
+        if counter["critical"] > 0:
+            overall_assessment = "critical"
+        elif counter["warning"] > 0:
+            overall_assessment = "warning"
+        elif counter["healthy"] == total:
+            overall_assessment = "healthy"
         else:
-            summary["overall_assessment"] = "mixed"
+            overall_assessment = "mixed"
         
-        return summary
-    
-    def _get_system_info(self) -> Dict[str, Any]:
-        """Get basic system information"""
         return {
-            "config": {
+            "healthy_components": counter["healthy"],
+            "warning_components": counter["warning"],
+            "critical_components": counter["critical"],
+            "offline_components": counter["offline"],
+            "total_components": total,
+            "overall_assessment": overall_assessment
+        }
+    
+    def _get_system_info(self) -> Mapping[str, Any]:
+        """Get basic system information (cached until component references change)"""
+        return self._system_info_cache
+    
+    def _build_system_info(self) -> Mapping[str, Any]:
+        """Build the read-only system information snapshot"""
+        return MappingProxyType({
+            "config": MappingProxyType({
                 "low_resource_mode": self.config.low_resource_mode,
                 "adaptive_streaming": self.config.adaptive_streaming,
                 "adaptive_quality": self.config.adaptive_quality,
                 "photos_dir": self.config.photos_dir,
                 "max_photos": self.config.max_photos
-            },
-            "component_availability": {
+            }),
+            "component_availability": MappingProxyType({
                 "health_monitor": self.health_monitor is not None,
                 "session_manager": self.session_manager is not None,
                 "recovery_manager": self.recovery_manager is not None,
                 "streaming_validator": self.streaming_validator is not None,
                 "camera_manager": self.camera_manager is not None
-            }
-        }
+            })
+        })
     
     # Quality and Validation Endpoints
     
-    def validate_stream_quality(self) -> Dict[str, Any]:
+    def validate_stream_quality(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Validate current stream quality with recommendations"""
         try:
             if not self.streaming_validator:
@@ -458,7 +569,7 @@ class HealthAPI:
             
             return {
                 "quality_report": quality_report,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
@@ -466,7 +577,7 @@ class HealthAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Stream quality validation failed: {str(e)}")
     
-    def detect_frozen_frames(self) -> Dict[str, Any]:
+    def detect_frozen_frames(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Check for frozen or stale frames"""
         try:
             if not self.streaming_validator:
@@ -476,7 +587,7 @@ class HealthAPI:
             
             return {
                 "frozen_frame_status": frozen_status,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or _now()
             }
             
         except HTTPException:
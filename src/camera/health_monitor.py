@@ -6,15 +6,23 @@ Detects issues like frozen frames, hardware timeouts, and resource problems.
 Coordinates automatic recovery actions.
 """
 
+import heapq
+import logging
 import time
 import threading
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Callable, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Optional, Deque, Dict, Any, Callable, List, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 
 from src.config import AppConfig
 from .camera_exceptions import handle_camera_error
+from .timeutil import monotonic_to_iso
+
+logger = logging.getLogger(__name__)
 
 
 class HealthStatus(Enum):
@@ -25,18 +33,49 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Enum members and clock bound once for the monitoring hot path
+_HEALTHY = HealthStatus.HEALTHY
+_WARNING = HealthStatus.WARNING
+_CRITICAL = HealthStatus.CRITICAL
+_UNKNOWN = HealthStatus.UNKNOWN
+_now = datetime.now
+
+# Statuses whose metrics may request recovery
+_RECOVERABLE_STATUSES = frozenset({_CRITICAL, _WARNING})
+
+
+# A metric message: literal text, or a (%-template, args) pair formatted on read
+HealthMessage = Union[str, Tuple[str, Tuple[Any, ...]]]
+
+
+def _render_message(message: HealthMessage) -> str:
+    """Format a metric message that may still be a (template, args) pair"""
+    return message if isinstance(message, str) else message[0] % message[1]
+
+
+@dataclass(slots=True)
 class HealthMetric:
     """Individual health metric"""
     name: str
     status: HealthStatus
     value: Any
-    message: str
-    last_updated: datetime
+    message: HealthMessage
+    last_updated: float  # time.monotonic() of the last update
     threshold_warning: Optional[float] = None
     threshold_critical: Optional[float] = None
 
 
+@dataclass(slots=True)
+class PerformanceSample:
+    """Streaming performance sample recorded by each stream check"""
+    timestamp: float  # time.monotonic() when the sample was taken
+    frame_rate: float
+    quality: int
+    frames_sent: int
+    frames_dropped: int
+    drop_rate: float
+
+
 @dataclass
 class RecoveryAction:
     """Recovery action definition"""
@@ -70,10 +109,22 @@ class HealthMonitor:
         self.config = config
         self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         
         # Health metrics storage
         self.metrics: Dict[str, HealthMetric] = {}
-        self.overall_status = HealthStatus.UNKNOWN
+        self.overall_status = _UNKNOWN
+        
+        # Incrementally maintained roll-ups of self.metrics
+        self._status_counts: Dict[HealthStatus, int] = {status: 0 for status in HealthStatus}
+        self._recovery_needed: Set[str] = set()
+        
+        # Rendered metrics for get_health_status as (metrics version,
+        # {name: (status, message, needs_recovery)}); the version changes with
+        # any of those, while last_updated is rendered on every read
+        self._metrics_version = 0
+        self._dirty = False  # set when a metric status changes, cleared by the monitoring loop
+        self._cached_metrics: Optional[Tuple[int, Dict[str, Tuple[str, str, Any]]]] = None
         
         # Component references (set by external components)
         self.camera_manager = None
@@ -84,28 +135,48 @@ class HealthMonitor:
         self.camera_check_interval = 10.0  # seconds
         self.stream_check_interval = 5.0   # seconds
         self.session_check_interval = 30.0 # seconds
+        self.check_timeout = 10.0          # seconds to wait for concurrent checks
+        
+        # time.monotonic() of each check's last run, keyed by check method
+        self._check_last_run: Dict[Callable[[float], None], float] = {}
+        
+        # Worker pool for concurrent checks (created on first use)
+        self._check_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Guards metrics, their roll-ups and last_recovery_attempt
+        self._lock = threading.Lock()
+        
+        # Camera manager results shared by the checks of one tick, as (now, result)
+        self.tick_cache_ttl = 1.0  # seconds
+        self._tick_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._tick_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._tick_cache_lock = threading.Lock()
         
         # Frame staleness detection
-        self.last_frame_time: Optional[float] = None
-        self.frame_stale_threshold = 10.0  # seconds
         self.consecutive_stale_frames = 0
         self.max_stale_frames = 3
+        self._last_frame_stats: Optional[Dict[str, Any]] = None
+        self._last_frame_count = -1  # -1 until the first sample
+        self._prev_streaming: Optional[bool] = None  # is_streaming at the previous check
         
         # Hardware timeout detection
-        self.last_hardware_check = time.time()
+        self.last_hardware_check = time.monotonic()
         self.hardware_timeout_threshold = 30.0  # seconds
         self.hardware_failures = 0
         self.max_hardware_failures = 3
         
         # Performance tracking
-        self.performance_history: List[Dict[str, Any]] = []
         self.max_history_length = 100
+        self.performance_history: Deque[PerformanceSample] = deque(maxlen=self.max_history_length)
         
         # Recovery coordination
-        self.recovery_actions: List[RecoveryAction] = []
+        # Min-heap of (priority, registration order, action)
+        self.recovery_actions: List[Tuple[int, int, RecoveryAction]] = []
         self.last_recovery_attempt = {}
+        self.recovery_cooldown = 30.0  # seconds between attempts per metric
+        self._cooldown_until: Dict[str, float] = {}  # time.monotonic() deadlines
         
-        print("🏥 HealthMonitor initialized")
+        logger.info("🏥 HealthMonitor initialized")
     
     def set_component_references(self, camera_manager=None, session_manager=None, recovery_manager=None):
         """Set references to other system components"""
@@ -118,9 +189,8 @@ class HealthMonitor:
     
     def register_recovery_action(self, action: RecoveryAction):
         """Register a recovery action"""
-        self.recovery_actions.append(action)
-        self.recovery_actions.sort(key=lambda x: x.priority)
-        print(f"🔧 Recovery action registered: {action.name} (priority: {action.priority})")
+        heapq.heappush(self.recovery_actions, (action.priority, len(self.recovery_actions), action))
+        logger.info("🔧 Recovery action registered: %s (priority: %s)", action.name, action.priority)
     
     def start_monitoring(self):
         """Start the health monitoring service"""
@@ -128,154 +198,239 @@ class HealthMonitor:
             return
         
         self.is_running = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitor_thread.start()
-        print("🏥 Health monitoring started")
+        logger.info("🏥 Health monitoring started")
     
     def stop_monitoring(self):
         """Stop the health monitoring service"""
         self.is_running = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5.0)
-        print("🏥 Health monitoring stopped")
+        if self._check_pool is not None:
+            self._check_pool.shutdown(wait=False)
+            self._check_pool = None
+        logger.info("🏥 Health monitoring stopped")
     
     def _monitoring_loop(self):
-        """Main monitoring loop"""
-        last_camera_check = 0
-        last_stream_check = 0
-        last_session_check = 0
-        
-        while self.is_running:
-            try:
-                current_time = time.time()
-                
-                # Camera health check
-                if current_time - last_camera_check >= self.camera_check_interval:
-                    self._check_camera_health()
-                    last_camera_check = current_time
-                
-                # Stream health check
-                if current_time - last_stream_check >= self.stream_check_interval:
-                    self._check_streaming_health()
-                    last_stream_check = current_time
-                
-                # Session health check
-                if current_time - last_session_check >= self.session_check_interval:
-                    self._check_session_health()
-                    last_session_check = current_time
-                
-                # Update overall status
+        """
+        Main monitoring loop
+        
+        Checks are kept in a min-heap of (deadline, order, interval, check)
+        and the thread sleeps on the stop event until the earliest one is due.
+        """
+        now = time.monotonic()
+        schedule = [
+            (now, order, interval, check)
+            for order, (interval, check) in enumerate((
+                (self.camera_check_interval, self._check_camera_health),
+                (self.stream_check_interval, self._check_streaming_health),
+                (self.session_check_interval, self._check_session_health),
+            ))
+        ]
+        heapq.heapify(schedule)
+        
+        while not self._stop_event.is_set():
+            delay = schedule[0][0] - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+                continue
+            
+            # Run every check that is due together, deferring any that a
+            # forced check already ran within its interval
+            now = time.monotonic()
+            due = []
+            while schedule and schedule[0][0] <= now:
+                entry = heapq.heappop(schedule)
+                _, order, interval, check = entry
+                next_run = self._check_last_run.get(check, float("-inf")) + interval
+                if next_run > now:
+                    heapq.heappush(schedule, (next_run, order, interval, check))
+                else:
+                    due.append(entry)
+            
+            if not due:
+                continue
+            
+            self._run_checks([check for _, _, _, check in due], now)
+            
+            for _, order, interval, check in due:
+                heapq.heappush(schedule, (now + interval, order, interval, check))
+            
+            # Update overall status, only if a metric changed
+            if self._dirty:
+                self._dirty = False
                 self._update_overall_status()
-                
-                # Check for recovery needs
-                self._check_recovery_needs()
-                
-                # Sleep before next iteration
-                time.sleep(1.0)
-                
-            except Exception as e:
-                print(f"❌ Health monitoring error: {e}")
-                time.sleep(5.0)  # Longer sleep on error
+            
+            # Check for recovery needs
+            if self._recovery_needed:
+                self._check_recovery_needs(now)
+    
+    def _run_checks(self, checks: List[Callable[[float], None]], now: float):
+        """
+        Run health checks concurrently so the total latency is that of the slowest
+        
+        Args:
+            checks: Check methods to run
+            now: time.monotonic() snapshot shared by all checks
+        """
+        for check in checks:
+            self._check_last_run[check] = now
+        
+        if len(checks) == 1:
+            self._run_check(checks[0], now)
+            return
+        
+        if self._check_pool is None:
+            self._check_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="health")
+        
+        futures = [self._check_pool.submit(self._run_check, check, now) for check in checks]
+        _, not_done = wait(futures, timeout=self.check_timeout)
+        
+        if not_done:
+            logger.warning("⚠️  %d health check(s) still running after %ss", len(not_done), self.check_timeout)
+    
+    def _run_check(self, check: Callable[[float], None], now: float):
+        """Run one check, recording a failure as its own metric so other checks are unaffected"""
+        name = check.__name__.lstrip("_")
+        try:
+            check(now)
+        except Exception as e:
+            logger.error("❌ Health check error in %s: %s", check.__name__, e)
+            self._update_metric(name, _WARNING, False, ("Check failed: %s", (e,)), now)
+        else:
+            # Clear a failure recorded by an earlier run
+            failure = self.metrics.get(name)
+            if failure is not None and failure.status is not _HEALTHY:
+                self._update_metric(name, _HEALTHY, False, "Check recovered", now)
+    
+    def _stats(self, now: float) -> Dict[str, Any]:
+        """Get camera_manager.get_streaming_stats(), fetched at most once per tick"""
+        with self._tick_cache_lock:
+            cached = self._tick_stats_cache
+            if cached is not None and now - cached[0] < self.tick_cache_ttl:
+                return cached[1]
+            stats = self.camera_manager.get_streaming_stats()
+            self._tick_stats_cache = (now, stats)
+            return stats
+    
+    def _camera_status(self, now: float) -> Dict[str, Any]:
+        """Get camera_manager.get_status(), fetched at most once per tick"""
+        with self._tick_cache_lock:
+            cached = self._tick_status_cache
+            if cached is not None and now - cached[0] < self.tick_cache_ttl:
+                return cached[1]
+            status = self.camera_manager.get_status()
+            self._tick_status_cache = (now, status)
+            return status
     
     @handle_camera_error
-    def _check_camera_health(self):
+    def _check_camera_health(self, now: float):
         """Check camera hardware health"""
         try:
             if not self.camera_manager:
-                self._update_metric("camera_availability", HealthStatus.UNKNOWN, False, 
-                                  "Camera manager not available")
+                self._update_metric("camera_availability", _UNKNOWN, False, 
+                                  "Camera manager not available", now)
                 return
             
             # Check if camera is initialized
             camera_available = self.camera_manager.camera_device is not None
-            status = HealthStatus.HEALTHY if camera_available else HealthStatus.CRITICAL
+            status = _HEALTHY if camera_available else _CRITICAL
             self._update_metric("camera_availability", status, camera_available,
-                              "Camera hardware available" if camera_available else "Camera hardware not available")
+                              "Camera hardware available" if camera_available else "Camera hardware not available", now)
             
             if camera_available:
                 # Check for hardware timeouts
-                self._check_hardware_timeouts()
+                self._check_hardware_timeouts(now)
                 
                 # Check frame generation
-                self._check_frame_generation()
+                self._check_frame_generation(now)
                 
                 # Check streaming status
-                self._check_streaming_status()
+                self._check_streaming_status(now)
         
         except Exception as e:
-            self._update_metric("camera_availability", HealthStatus.CRITICAL, False,
-                              f"Camera health check failed: {str(e)}")
+            self._update_metric("camera_availability", _CRITICAL, False,
+                              ("Camera health check failed: %s", (e,)), now)
             self.hardware_failures += 1
     
-    def _check_hardware_timeouts(self):
+    def _check_hardware_timeouts(self, now: float):
         """Check for hardware timeout issues"""
         try:
             # Get camera status to verify hardware responsiveness
             if self.camera_manager:
-                status = self.camera_manager.get_status()
+                status = self._camera_status(now)
                 
                 # Check if camera is responsive
                 if status.get("available", False):
                     self.hardware_failures = 0  # Reset failure counter
-                    self.last_hardware_check = time.time()
-                    self._update_metric("hardware_timeout", HealthStatus.HEALTHY, False,
-                                      "Hardware responding normally")
+                    self.last_hardware_check = now
+                    self._update_metric("hardware_timeout", _HEALTHY, False,
+                                      "Hardware responding normally", now)
                 else:
                     self.hardware_failures += 1
                     
                 # Check for repeated hardware failures
                 if self.hardware_failures >= self.max_hardware_failures:
-                    self._update_metric("hardware_timeout", HealthStatus.CRITICAL, True,
-                                      f"Hardware failures detected: {self.hardware_failures}")
+                    self._update_metric("hardware_timeout", _CRITICAL, True,
+                                      ("Hardware failures detected: %d", (self.hardware_failures,)), now)
                 elif self.hardware_failures > 0:
-                    self._update_metric("hardware_timeout", HealthStatus.WARNING, False,
-                                      f"Hardware instability detected: {self.hardware_failures} failures")
+                    self._update_metric("hardware_timeout", _WARNING, False,
+                                      ("Hardware instability detected: %d failures", (self.hardware_failures,)), now)
         
         except Exception as e:
             self.hardware_failures += 1
-            self._update_metric("hardware_timeout", HealthStatus.WARNING, False,
-                              f"Hardware timeout check failed: {str(e)}")
+            self._update_metric("hardware_timeout", _WARNING, False,
+                              ("Hardware timeout check failed: %s", (e,)), now)
     
-    def _check_frame_generation(self):
+    def _check_frame_generation(self, now: float):
         """Check if frames are being generated and not stale"""
         try:
-            if not self.camera_manager or not self.camera_manager.is_streaming:
-                self._update_metric("frame_generation", HealthStatus.HEALTHY, True,
-                                  "Streaming not active")
+            active = bool(self.camera_manager and self.camera_manager.is_streaming)
+            was_active = self._prev_streaming
+            self._prev_streaming = active
+            if not active:
+                # Idle stays idle: the metric only changes on a transition
+                if was_active is not False:
+                    self._update_metric("frame_generation", _HEALTHY, True,
+                                      "Streaming not active", now)
                 return
             
-            # Get streaming stats
-            stats = self.camera_manager.get_streaming_stats()
+            # Get streaming stats; a snapshot already evaluated says nothing new
+            stats = self._stats(now)
+            if stats is self._last_frame_stats:
+                return
+            self._last_frame_stats = stats
             
             # Check frame generation rate
-            current_time = time.time()
             frames_sent = stats.get("adaptation", {}).get("frames_sent", 0)
             
             # Detect stale frames by checking if frame count is increasing
-            if hasattr(self, '_last_frame_count'):
-                if frames_sent <= self._last_frame_count:
-                    self.consecutive_stale_frames += 1
-                else:
-                    self.consecutive_stale_frames = 0
+            if self._last_frame_count >= 0 and frames_sent <= self._last_frame_count:
+                self.consecutive_stale_frames += 1
+            else:
+                self.consecutive_stale_frames = 0
             
             self._last_frame_count = frames_sent
             
             # Evaluate frame generation health
             if self.consecutive_stale_frames >= self.max_stale_frames:
-                self._update_metric("frame_generation", HealthStatus.CRITICAL, True,
-                                  f"Frames appear frozen: {self.consecutive_stale_frames} consecutive stale checks")
+                self._update_metric("frame_generation", _CRITICAL, True,
+                                  ("Frames appear frozen: %d consecutive stale checks", (self.consecutive_stale_frames,)), now)
             elif self.consecutive_stale_frames > 0:
-                self._update_metric("frame_generation", HealthStatus.WARNING, False,
-                                  f"Frame generation may be slow: {self.consecutive_stale_frames} stale checks")
+                self._update_metric("frame_generation", _WARNING, False,
+                                  ("Frame generation may be slow: %d stale checks", (self.consecutive_stale_frames,)), now)
             else:
-                self._update_metric("frame_generation", HealthStatus.HEALTHY, False,
-                                  "Frames generating normally")
+                self._update_metric("frame_generation", _HEALTHY, False,
+                                  "Frames generating normally", now)
         
         except Exception as e:
-            self._update_metric("frame_generation", HealthStatus.WARNING, False,
-                              f"Frame generation check failed: {str(e)}")
+            self._update_metric("frame_generation", _WARNING, False,
+                              ("Frame generation check failed: %s", (e,)), now)
     
-    def _check_streaming_status(self):
+    def _check_streaming_status(self, now: float):
         """Check streaming health and performance"""
         try:
             if not self.camera_manager:
@@ -285,7 +440,7 @@ class HealthMonitor:
             
             if streaming_active:
                 # Get detailed streaming stats
-                stats = self.camera_manager.get_streaming_stats()
+                stats = self._stats(now)
                 performance = stats.get("performance", {})
                 
                 # Check for network issues
@@ -293,52 +448,62 @@ class HealthMonitor:
                 frames_dropped = performance.get("frames_dropped", 0)
                 
                 if network_slow or frames_dropped > 10:
-                    self._update_metric("streaming_performance", HealthStatus.WARNING, False,
-                                      f"Streaming issues detected: slow_network={network_slow}, dropped_frames={frames_dropped}")
+                    self._update_metric("streaming_performance", _WARNING, False,
+                                      ("Streaming issues detected: slow_network=%s, dropped_frames=%s", (network_slow, frames_dropped)), now)
                 else:
-                    self._update_metric("streaming_performance", HealthStatus.HEALTHY, False,
-                                      "Streaming performance normal")
+                    self._update_metric("streaming_performance", _HEALTHY, False,
+                                      "Streaming performance normal", now)
             else:
-                self._update_metric("streaming_performance", HealthStatus.HEALTHY, False,
-                                  "Streaming not active")
+                self._update_metric("streaming_performance", _HEALTHY, False,
+                                  "Streaming not active", now)
         
         except Exception as e:
-            self._update_metric("streaming_performance", HealthStatus.WARNING, False,
-                              f"Streaming status check failed: {str(e)}")
+            self._update_metric("streaming_performance", _WARNING, False,
+                              ("Streaming status check failed: %s", (e,)), now)
     
-    def _check_streaming_health(self):
+    def _check_streaming_health(self, now: float):
         """Check detailed streaming health"""
         try:
             if not self.camera_manager or not self.camera_manager.is_streaming:
                 return
             
             # Get comprehensive streaming metrics
-            metrics = self.camera_manager.get_streaming_stats()
+            metrics = self._stats(now)
             
             # Check adaptation metrics
             adaptation = metrics.get("adaptation", {})
             drop_rate = adaptation.get("drop_rate", 0.0)
+            sample = PerformanceSample(
+                timestamp=now,
+                frame_rate=adaptation.get("current_frame_rate", 0),
+                quality=adaptation.get("current_quality", 0),
+                frames_sent=adaptation.get("frames_sent", 0),
+                frames_dropped=adaptation.get("frames_dropped", 0),
+                drop_rate=drop_rate
+            )
+            with self._lock:
+                self.performance_history.append(sample)
             
             if drop_rate > 0.5:  # More than 50% drops
-                self._update_metric("stream_quality", HealthStatus.CRITICAL, True,
-                                  f"High frame drop rate: {drop_rate:.2%}")
+                self._update_metric("stream_quality", _CRITICAL, True,
+                                  ("High frame drop rate: %.2f%%", (drop_rate * 100,)), now)
             elif drop_rate > 0.1:  # More than 10% drops
-                self._update_metric("stream_quality", HealthStatus.WARNING, False,
-                                  f"Elevated frame drop rate: {drop_rate:.2%}")
+                self._update_metric("stream_quality", _WARNING, False,
+                                  ("Elevated frame drop rate: %.2f%%", (drop_rate * 100,)), now)
             else:
-                self._update_metric("stream_quality", HealthStatus.HEALTHY, False,
-                                  f"Stream quality good: {drop_rate:.2%} drop rate")
+                self._update_metric("stream_quality", _HEALTHY, False,
+                                  ("Stream quality good: %.2f%% drop rate", (drop_rate * 100,)), now)
         
         except Exception as e:
-            self._update_metric("stream_quality", HealthStatus.WARNING, False,
-                              f"Stream health check failed: {str(e)}")
+            self._update_metric("stream_quality", _WARNING, False,
+                              ("Stream health check failed: %s", (e,)), now)
     
-    def _check_session_health(self):
+    def _check_session_health(self, now: float):
         """Check session management health"""
         try:
             if not self.session_manager:
-                self._update_metric("session_management", HealthStatus.UNKNOWN, False,
-                                  "Session manager not available")
+                self._update_metric("session_management", _UNKNOWN, False,
+                                  "Session manager not available", now)
                 return
             
             # Get session statistics
@@ -348,109 +513,193 @@ class HealthMonitor:
             
             # Check for session issues
             if active_sessions > 10:  # Too many active sessions
-                self._update_metric("session_management", HealthStatus.WARNING, False,
-                                  f"High number of active sessions: {active_sessions}")
+                self._update_metric("session_management", _WARNING, False,
+                                  ("High number of active sessions: %d", (active_sessions,)), now)
             else:
-                self._update_metric("session_management", HealthStatus.HEALTHY, False,
-                                  f"Session management healthy: {active_sessions} active sessions")
+                self._update_metric("session_management", _HEALTHY, False,
+                                  ("Session management healthy: %d active sessions", (active_sessions,)), now)
         
         except Exception as e:
-            self._update_metric("session_management", HealthStatus.WARNING, False,
-                              f"Session health check failed: {str(e)}")
+            self._update_metric("session_management", _WARNING, False,
+                              ("Session health check failed: %s", (e,)), now)
     
-    def _update_metric(self, name: str, status: HealthStatus, needs_recovery: bool, message: str):
-        """Update a health metric"""
-        self.metrics[name] = HealthMetric(
-            name=name,
-            status=status,
-            value=needs_recovery,
-            message=message,
-            last_updated=datetime.now()
-        )
+    def _update_metric(self, name: str, status: HealthStatus, needs_recovery: bool, message: HealthMessage,
+                       now: float):
+        """Update a health metric in place, creating it on first use (now is time.monotonic())"""
+        with self._lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                self.metrics[name] = HealthMetric(
+                    name=name,
+                    status=status,
+                    value=needs_recovery,
+                    message=message,
+                    last_updated=now
+                )
+                changed = rendered_changed = True
+            else:
+                changed = metric.status is not status or metric.value != needs_recovery
+                rendered_changed = changed or metric.message != message
+                self._status_counts[metric.status] -= 1
+                metric.status = status
+                metric.value = needs_recovery
+                metric.message = message
+                metric.last_updated = now
+            self._status_counts[status] += 1
+            if rendered_changed:
+                self._metrics_version += 1
+            if changed:
+                self._dirty = True
+            
+            if needs_recovery is True and status in _RECOVERABLE_STATUSES:
+                self._recovery_needed.add(name)
+            else:
+                self._recovery_needed.discard(name)
     
     def _update_overall_status(self):
         """Update overall system health status"""
-        if not self.metrics:
-            self.overall_status = HealthStatus.UNKNOWN
-            return
-        
-        # Determine overall status based on individual metrics
-        has_critical = any(m.status == HealthStatus.CRITICAL for m in self.metrics.values())
-        has_warning = any(m.status == HealthStatus.WARNING for m in self.metrics.values())
+        counts = self._status_counts
         
-        if has_critical:
-            self.overall_status = HealthStatus.CRITICAL
-        elif has_warning:
-            self.overall_status = HealthStatus.WARNING
+        if not self.metrics:
+            self.overall_status = _UNKNOWN
+        elif counts[_CRITICAL]:
+            self.overall_status = _CRITICAL
+        elif counts[_WARNING]:
+            self.overall_status = _WARNING
         else:
-            self.overall_status = HealthStatus.HEALTHY
+            self.overall_status = _HEALTHY
     
-    def _check_recovery_needs(self):
+    def _check_recovery_needs(self, now: float):
         """Check if any metrics need recovery actions"""
         try:
-            for metric in self.metrics.values():
-                if metric.value is True and metric.status in [HealthStatus.CRITICAL, HealthStatus.WARNING]:
-                    self._trigger_recovery(metric)
+            with self._lock:
+                cooldown_until = self._cooldown_until
+                pending = [
+                    self.metrics[name] for name in self._recovery_needed
+                    if now >= cooldown_until.get(name, 0.0)
+                ]
+            
+            for metric in pending:
+                self._trigger_recovery(metric, now)
         except Exception as e:
-            print(f"❌ Recovery check failed: {e}")
+            logger.error("❌ Recovery check failed: %s", e)
     
-    def _trigger_recovery(self, metric: HealthMetric):
+    def _trigger_recovery(self, metric: HealthMetric, now: float):
         """Trigger recovery actions for a failed metric"""
         if not self.recovery_manager:
             return
         
-        # Check cooldown
-        last_attempt = self.last_recovery_attempt.get(metric.name, 0)
-        if time.time() - last_attempt < 30:  # 30 second cooldown
-            return
-        
-        print(f"🚨 Triggering recovery for: {metric.name} - {metric.message}")
+        # Check cooldown and claim the attempt before releasing the lock
+        with self._lock:
+            if now < self._cooldown_until.get(metric.name, 0.0):
+                return
+            self._cooldown_until[metric.name] = now + self.recovery_cooldown
+            self.last_recovery_attempt[metric.name] = now
         
-        # Delegate to recovery manager
-        success = self.recovery_manager.attempt_recovery(metric.name, metric)
+        logger.warning("🚨 Triggering recovery for: %s - %s", metric.name, _render_message(metric.message))
         
-        self.last_recovery_attempt[metric.name] = time.time()
+        # Delegate to recovery manager; it runs on the recovery worker so the
+        # monitoring loop is not held up by the strategies
+        future = self.recovery_manager.attempt_recovery(metric.name, metric)
+        if future is None:
+            logger.info("⏭️ Recovery skipped for: %s", metric.name)
+            return
         
-        if success:
-            print(f"✅ Recovery successful for: {metric.name}")
+        name = metric.name
+        future.add_done_callback(lambda f: self._on_recovery_done(name, f))
+    
+    def _on_recovery_done(self, name: str, future: Future):
+        """Log the outcome of a recovery started by _trigger_recovery"""
+        if not future.cancelled() and future.exception() is None and future.result():
+            logger.info("✅ Recovery successful for: %s", name)
         else:
-            print(f"❌ Recovery failed for: {metric.name}")
+            logger.error("❌ Recovery failed for: %s", name)
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status"""
         return {
             "overall_status": self.overall_status.value,
-            "timestamp": datetime.now().isoformat(),
-            "metrics": {
-                name: {
-                    "status": metric.status.value,
-                    "message": metric.message,
-                    "last_updated": metric.last_updated.isoformat(),
-                    "needs_recovery": metric.value
-                }
-                for name, metric in self.metrics.items()
-            },
+            "timestamp": _now().isoformat(),
+            "metrics": self._get_rendered_metrics(),
             "monitoring_active": self.is_running,
             "hardware_failures": self.hardware_failures,
             "consecutive_stale_frames": self.consecutive_stale_frames
         }
     
+    def _get_rendered_metrics(self) -> Dict[str, Any]:
+        """Get metrics as plain dicts, re-rendering messages only after a metric changed"""
+        with self._lock:
+            version = self._metrics_version
+            last_updated = [(name, metric.last_updated) for name, metric in self.metrics.items()]
+            cached = self._cached_metrics
+            if cached is None or cached[0] != version:
+                snapshot = [
+                    (name, metric.status, metric.message, metric.value)
+                    for name, metric in self.metrics.items()
+                ]
+                cached = None
+        
+        if cached is None:
+            rendered = {
+                name: (status.value, _render_message(message), needs_recovery)
+                for name, status, message, needs_recovery in snapshot
+            }
+            self._cached_metrics = (version, rendered)
+        else:
+            rendered = cached[1]
+        
+        wall_now = _now()
+        mono_now = time.monotonic()
+        metrics = {}
+        for name, updated in last_updated:
+            status, message, needs_recovery = rendered[name]
+            metrics[name] = {
+                "status": status,
+                "message": message,
+                "last_updated": monotonic_to_iso(updated, mono_now, wall_now),
+                "needs_recovery": needs_recovery
+            }
+        return metrics
+    
     def get_detailed_diagnostics(self) -> Dict[str, Any]:
         """Get detailed diagnostic information"""
         diagnostics = self.get_health_status()
         
+        wall_now = _now()
+        mono_now = time.monotonic()
+        
         # Add performance history
-        diagnostics["performance_history"] = self.performance_history[-10:]  # Last 10 entries
+        with self._lock:
+            history = self.performance_history
+            samples = list(islice(history, max(0, len(history) - 10), None))  # Last 10 entries
+        diagnostics["performance_history"] = [
+            {
+                "timestamp": monotonic_to_iso(sample.timestamp, mono_now, wall_now),
+                "frame_rate": sample.frame_rate,
+                "quality": sample.quality,
+                "frames_sent": sample.frames_sent,
+                "frames_dropped": sample.frames_dropped,
+                "drop_rate": round(sample.drop_rate, 4)
+            }
+            for sample in samples
+        ]
         
         # Add recovery action status
+        with self._lock:
+            last_attempts = dict(self.last_recovery_attempt)
+            cooldown_until = dict(self._cooldown_until)
         diagnostics["recovery_actions"] = [
             {
                 "name": action.name,
                 "priority": action.priority,
                 "description": action.description,
-                "last_attempt": self.last_recovery_attempt.get(action.name)
+                "last_attempt": (
+                    monotonic_to_iso(last_attempts[action.name], mono_now, wall_now)
+                    if action.name in last_attempts else None
+                ),
+                "next_attempt_in": round(max(0.0, cooldown_until.get(action.name, 0.0) - mono_now), 1)
             }
-            for action in self.recovery_actions
+            for _, _, action in sorted(self.recovery_actions)
         ]
         
         # Add system information
@@ -461,7 +710,6 @@ class HealthMonitor:
                 "session_check": self.session_check_interval
             },
             "thresholds": {
-                "frame_stale_threshold": self.frame_stale_threshold,
                 "max_stale_frames": self.max_stale_frames,
                 "hardware_timeout_threshold": self.hardware_timeout_threshold,
                 "max_hardware_failures": self.max_hardware_failures
@@ -470,21 +718,42 @@ class HealthMonitor:
         
         return diagnostics
     
-    def force_health_check(self) -> Dict[str, Any]:
-        """Force an immediate comprehensive health check"""
-        print("🏥 Forcing comprehensive health check...")
+    def force_health_check(self, max_age: float = 1.0) -> Dict[str, Any]:
+        """
+        Force an immediate comprehensive health check
+        
+        Args:
+            max_age: Checks that ran within this many seconds are not re-run
+        """
+        logger.info("🏥 Forcing comprehensive health check...")
         
-        self._check_camera_health()
-        self._check_streaming_health()
-        self._check_session_health()
+        now = time.monotonic()
+        last_run = self._check_last_run
+        stale = [
+            check for check in (
+                self._check_camera_health,
+                self._check_streaming_health,
+                self._check_session_health
+            )
+            if now - last_run.get(check, float("-inf")) >= max_age
+        ]
+        if stale:
+            self._run_checks(stale, now)
         self._update_overall_status()
         
         return self.get_health_status()
     
     def reset_metrics(self):
         """Reset all health metrics"""
-        self.metrics.clear()
-        self.hardware_failures = 0
-        self.consecutive_stale_frames = 0
-        self.last_recovery_attempt.clear()
-        print("🏥 Health metrics reset")
+        with self._lock:
+            self.metrics.clear()
+            self._status_counts = {status: 0 for status in HealthStatus}
+            self._recovery_needed.clear()
+            self._metrics_version += 1
+            self._dirty = True
+            self.hardware_failures = 0
+            self.consecutive_stale_frames = 0
+            self.last_recovery_attempt.clear()
+            self._cooldown_until.clear()
+            self._prev_streaming = None
+        logger.info("🏥 Health metrics reset")
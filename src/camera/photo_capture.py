@@ -5,13 +5,21 @@ Handles still photo capture without interrupting video streaming,
 including file management, metadata, and directory organization.
 """
 
+import heapq
+import itertools
+import logging
 import os
+import re
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from src.config import AppConfig
 from .camera_exceptions import PhotoCaptureError, handle_camera_error
 
+logger = logging.getLogger(__name__)
+
 # Import picamera2 - graceful handling for development environments
 try:
     from picamera2 import Picamera2 # type: ignore
@@ -27,6 +35,66 @@ except ImportError:
         def release(self): pass
 
 
+# Extensions (lowercase, with the dot) treated as photos
+_PHOTO_EXTS = frozenset({'.jpg', '.jpeg', '.png'})
+
+# Filenames accepted from callers: a plain name with a photo extension, so
+# path separators and traversal are impossible
+_SAFE_FILENAME_RE = re.compile(r'[A-Za-z0-9._-]{1,128}\.(?:jpe?g|png)', re.IGNORECASE)
+
+# time.strftime format for the timestamp part of photo filenames
+_FILENAME_FMT = "photo_%Y%m%d_%H%M%S"
+
+# Contents of the placeholder file written by simulated captures
+_SIMULATED_PHOTO_CONTENT = b"Simulated photo"
+
+# Whether files can be unlinked relative to an open directory descriptor
+_UNLINK_SUPPORTS_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def _drop_page_cache(filepath: str):
+    """Ask the kernel to evict a just-written file from the page cache"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            # Dirty pages are not dropped, so flush them first
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning("⚠️  Could not drop %s from page cache: %s", filepath, e)
+
+
+@dataclass(slots=True)
+class _PhotoScan:
+    """One scan of the photos directory, valid while its mtime is unchanged"""
+    dir_mtime: int  # st_mtime_ns of the photos directory when scanned
+    photos: List[Tuple[str, os.stat_result]]
+    total_bytes: int
+    listing: Optional[List[dict]] = None  # list_photos result, built on first use
+
+
+def _created_ns(photo: Tuple[str, os.stat_result]) -> int:
+    """Ordering key for scanned (filename, stat) pairs, shared by listing and cleanup"""
+    return photo[1].st_ctime_ns
+
+
+def _format_for_api(record: dict) -> dict:
+    """Convert an internal photo record to the API shape with ISO timestamps"""
+    return {
+        "filename": record["filename"],
+        "filepath": record["filepath"],
+        "size": record["size"],
+        "created": datetime.fromtimestamp(record["created_ns"] / 1e9).isoformat(),
+        "modified": datetime.fromtimestamp(record["modified_ns"] / 1e9).isoformat(),
+        "size_mb": record["size_mb"]
+    }
+
+
 class PhotoCapture:
     """
     Manages high-resolution photo capture operations
@@ -37,14 +105,47 @@ class PhotoCapture:
     
     def __init__(self, config: AppConfig):
         self.config = config
-        self.photos_captured: int = 0
-        self.last_capture_time: Optional[float] = None
+        
+        # Capture statistics; next() on the counter is atomic under the GIL,
+        # so captures on different threads update these without taking a lock
+        self._capture_counter = itertools.count(1)
+        self._photos_captured: int = 0
+        self._last_capture_time_ns: Optional[int] = None
+        
+        # Last directory scan, shared by listing, cleanup and storage totals
+        self._scan_cache: Optional[_PhotoScan] = None
+        
+        # One capture at a time, since each holds camera buffers until saved
+        self._capture_lock = threading.Lock()
+        
+        # Set once the photos directory is known to exist; cleared when a
+        # save fails in case it was removed
+        self._dir_ready = False
+        
+        # Per-process sequence appended to filenames so captures within the
+        # same second do not overwrite each other
+        self._filename_seq = itertools.count()
+    
+    @property
+    def photos_captured(self) -> int:
+        """Number of photos captured since startup"""
+        return self._photos_captured
+    
+    @property
+    def last_capture_time(self) -> Optional[float]:
+        """Unix time of the last capture, or None before the first one"""
+        if self._last_capture_time_ns is None:
+            return None
+        return self._last_capture_time_ns / 1e9
     
     @handle_camera_error
     def capture_photo(self, camera_device: Picamera2) -> Tuple[bool, str, str]:
         """
         Capture high-resolution still photo without interrupting video stream
         
+        This call blocks until the photo is encoded and written, so async
+        callers should run it in a thread rather than on the event loop.
+        
         Args:
             camera_device: Active Picamera2 instance
             
@@ -62,7 +163,7 @@ class PhotoCapture:
             return self._simulate_photo_capture()
         
         try:
-            print("📸 Capturing high-resolution photo...")
+            logger.info("📸 Capturing high-resolution photo...")
             
             # Ensure photos directory exists
             self._ensure_photos_directory()
@@ -71,48 +172,68 @@ class PhotoCapture:
             filename = self._generate_filename()
             filepath = self._get_full_filepath(filename)
             
-            # Capture from main stream (full resolution) while lores continues streaming
-            request = camera_device.capture_request()
-            try:
-                request.save("main", filepath)
-                print(f"✅ Photo saved: {filename}")
-                
-                # Update capture statistics
-                self.photos_captured += 1
-                self.last_capture_time = time.time()
-                
-                return True, "Photo captured successfully", filename
-                
-            finally:
-                # Critical: release the request to free memory
-                request.release()
+            with self._capture_lock:
+                # Capture from main stream (full resolution) while lores continues streaming
+                request = camera_device.capture_request()
+                self._save_request(request, filepath, filename)
+            
+            return True, "Photo captured successfully", filename
             
         except Exception as e:
-            print(f"❌ Photo capture failed: {e}")
+            self._dir_ready = False
+            logger.error("❌ Photo capture failed: %s", e)
             raise PhotoCaptureError(f"Capture failed: {str(e)}")
     
+    def _save_request(self, request, filepath: str, filename: str):
+        """Encode and write a captured request, then release it"""
+        try:
+            request.save("main", filepath)
+            if self.config.photo_drop_page_cache:
+                _drop_page_cache(filepath)
+            self._record_capture()
+            logger.info("✅ Photo saved: %s", filename)
+        finally:
+            # Critical: release the request to free memory
+            request.release()
+    
+    def _record_capture(self):
+        """Update capture statistics for a saved photo"""
+        self._photos_captured = next(self._capture_counter)
+        self._last_capture_time_ns = time.time_ns()
+        self._invalidate_scan()
+    
     def _simulate_photo_capture(self) -> Tuple[bool, str, str]:
         """Simulate photo capture for development environments"""
-        print("📸 Simulating photo capture (development mode)...")
+        logger.info("📸 Simulating photo capture (development mode)...")
         
         self._ensure_photos_directory()
         filename = self._generate_filename()
         filepath = self._get_full_filepath(filename)
         
-        # Create a dummy file for testing
-        with open(filepath, 'w') as f:
-            f.write(f"Simulated photo captured at {datetime.now().isoformat()}")
+        # Create a dummy file for testing (the filename carries the timestamp)
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        except OSError:
+            self._dir_ready = False
+            raise
+        try:
+            os.write(fd, _SIMULATED_PHOTO_CONTENT)
+        finally:
+            os.close(fd)
         
-        self.photos_captured += 1
-        self.last_capture_time = time.time()
+        self._record_capture()
         
-        print(f"✅ Simulated photo saved: {filename}")
+        logger.info("✅ Simulated photo saved: %s", filename)
         return True, "Photo captured successfully (simulated)", filename
     
     def _ensure_photos_directory(self):
         """Ensure the photos directory exists"""
+        if self._dir_ready:
+            return
+        
         try:
             os.makedirs(self.config.photos_dir, exist_ok=True)
+            self._dir_ready = True
         except Exception as e:
             raise PhotoCaptureError(f"Failed to create photos directory: {str(e)}")
     
@@ -121,10 +242,9 @@ class PhotoCapture:
         Generate a unique filename with timestamp
         
         Returns:
-            str: Filename in format 'photo_YYYYMMDD_HHMMSS.jpg'
+            str: Filename in format 'photo_YYYYMMDD_HHMMSS_NNNN.jpg'
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"photo_{timestamp}.jpg"
+        return f"{time.strftime(_FILENAME_FMT)}_{next(self._filename_seq):04d}.jpg"
     
     def _get_full_filepath(self, filename: str) -> str:
         """
@@ -138,35 +258,38 @@ class PhotoCapture:
         """
         return os.path.join(self.config.photos_dir, filename)
     
-    def get_photo_info(self, filename: str) -> Optional[dict]:
+    def get_photo_info(self, filename: str, stat_result: Optional[os.stat_result] = None) -> Optional[dict]:
         """
         Get information about a captured photo
         
         Args:
             filename: The photo filename
+            stat_result: Already fetched stat of the file, skips the stat call
             
         Returns:
             dict: Photo information or None if file doesn't exist
         """
-        filepath = self._get_full_filepath(filename)
-        
-        if not os.path.exists(filepath):
-            return None
-        
         try:
-            stat = os.stat(filepath)
-            return {
-                "filename": filename,
-                "filepath": filepath,
-                "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "size_mb": round(stat.st_size / (1024 * 1024), 2)
-            }
+            if stat_result is None:
+                stat_result = os.stat(self._get_full_filepath(filename))
+            return _format_for_api(self._photo_record(filename, stat_result))
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            print(f"⚠️  Error getting photo info for {filename}: {e}")
+            logger.warning("⚠️  Error getting photo info for %s: %s", filename, e)
             return None
     
+    def _photo_record(self, filename: str, stat: os.stat_result) -> dict:
+        """Build the internal photo record, keeping timestamps as integer nanoseconds"""
+        return {
+            "filename": filename,
+            "filepath": self._get_full_filepath(filename),
+            "size": stat.st_size,
+            "created_ns": stat.st_ctime_ns,
+            "modified_ns": stat.st_mtime_ns,
+            "size_mb": round(stat.st_size / (1024 * 1024), 2)
+        }
+    
     def list_photos(self) -> list:
         """
         List all captured photos with metadata
@@ -176,27 +299,27 @@ class PhotoCapture:
         """
         photos = []
         
-        if not os.path.exists(self.config.photos_dir):
-            return photos
-        
         try:
-            for filename in os.listdir(self.config.photos_dir):
-                if self._is_photo_file(filename):
-                    photo_info = self.get_photo_info(filename)
-                    if photo_info:
-                        photos.append(photo_info)
-            
-            # Sort by creation time (newest first)
-            photos.sort(key=lambda x: x["created"], reverse=True)
+            scan = self._scan()
+            if scan.listing is not None:
+                return list(scan.listing)
             
-            # Apply max photos limit if configured
+            # Sort by creation time (newest first), applying the max photos
+            # limit if configured, before any dates are formatted
             if self.config.max_photos > 0:
-                photos = photos[:self.config.max_photos]
+                scanned = heapq.nlargest(self.config.max_photos, scan.photos, key=_created_ns)
+            else:
+                scanned = sorted(scan.photos, key=_created_ns, reverse=True)
             
-            return photos
+            photos = [_format_for_api(self._photo_record(filename, stat)) for filename, stat in scanned]
             
+            scan.listing = photos
+            return list(photos)
+            
+        except FileNotFoundError:
+            return photos
         except Exception as e:
-            print(f"⚠️  Error listing photos: {e}")
+            logger.warning("⚠️  Error listing photos: %s", e)
             return []
     
     def delete_photo(self, filename: str) -> Tuple[bool, str]:
@@ -220,42 +343,64 @@ class PhotoCapture:
         
         try:
             os.remove(filepath)
-            print(f"🗑️  Photo deleted: {filename}")
+            self._invalidate_scan()
+            logger.info("🗑️  Photo deleted: %s", filename)
             return True, f"Photo {filename} deleted successfully"
             
         except Exception as e:
             error_msg = f"Failed to delete photo: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             return False, error_msg
     
     def cleanup_old_photos(self) -> Tuple[int, int]:
         """
         Clean up old photos if max_photos limit is exceeded
         
+        Photos beyond the limit, oldest first by creation time, are deleted
+        from disk.
+        
         Returns:
             Tuple[int, int]: (photos_deleted, photos_remaining)
         """
-        if self.config.max_photos <= 0:
-            return 0, len(self.list_photos())
+        photos_dir = self.config.photos_dir
+        
+        try:
+            photos = self._scan().photos
+        except FileNotFoundError:
+            return 0, 0
         
-        photos = self.list_photos()
         photos_to_delete = len(photos) - self.config.max_photos
         
-        if photos_to_delete <= 0:
+        if self.config.max_photos <= 0 or photos_to_delete <= 0:
             return 0, len(photos)
         
         deleted_count = 0
         
-        # Delete oldest photos (photos are sorted newest first)
-        for photo in photos[-photos_to_delete:]:
-            success, _ = self.delete_photo(photo["filename"])
-            if success:
-                deleted_count += 1
+        # Delete the oldest photos by the creation time order list_photos uses,
+        # so exactly the photos it leaves out are removed. Names come straight
+        # from scandir so the filename validation in delete_photo is not
+        # needed. Unlinking relative to one open directory fd skips resolving
+        # the full path for every file.
+        dir_fd = os.open(photos_dir, os.O_RDONLY | os.O_DIRECTORY) if _UNLINK_SUPPORTS_DIR_FD else None
+        try:
+            for filename, _ in heapq.nsmallest(photos_to_delete, photos, key=_created_ns):
+                try:
+                    if dir_fd is not None:
+                        os.unlink(filename, dir_fd=dir_fd)
+                    else:
+                        os.remove(os.path.join(photos_dir, filename))
+                    deleted_count += 1
+                except Exception as e:
+                    logger.error("❌ Failed to delete photo %s: %s", filename, e)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
         
         remaining_photos = len(photos) - deleted_count
         
         if deleted_count > 0:
-            print(f"🧹 Cleaned up {deleted_count} old photos, {remaining_photos} remaining")
+            self._invalidate_scan()
+            logger.info("🧹 Cleaned up %d old photos, %d remaining", deleted_count, remaining_photos)
         
         return deleted_count, remaining_photos
     
@@ -266,12 +411,11 @@ class PhotoCapture:
         Returns:
             dict: Capture statistics
         """
-        photos_list = self.list_photos()
-        total_size = sum(photo["size"] for photo in photos_list)
+        photos_stored, total_size = self._get_storage_totals()
         
         return {
             "photos_captured": self.photos_captured,
-            "photos_stored": len(photos_list),
+            "photos_stored": photos_stored,
             "last_capture_time": self.last_capture_time,
             "total_storage_bytes": total_size,
             "total_storage_mb": round(total_size / (1024 * 1024), 2),
@@ -279,24 +423,85 @@ class PhotoCapture:
             "max_photos_limit": self.config.max_photos
         }
     
+    def get_storage_usage(self) -> Tuple[int, float]:
+        """
+        Get the total size of stored photos from the cached directory scan
+        
+        Unlike get_photos_directory_size, this does not walk the directory
+        unless photos were added or removed since the last scan.
+        
+        Returns:
+            Tuple[int, float]: (total_bytes, total_mb)
+        """
+        _, total_size = self._get_storage_totals()
+        return total_size, round(total_size / (1024 * 1024), 2)
+    
+    def _get_storage_totals(self) -> Tuple[int, int]:
+        """
+        Get the number and total size of stored photos
+        
+        Returns:
+            Tuple[int, int]: (photos_stored, total_bytes)
+        """
+        try:
+            scan = self._scan()
+        except FileNotFoundError:
+            return 0, 0
+        except Exception as e:
+            logger.warning("⚠️  Error calculating photo storage: %s", e)
+            return 0, 0
+        
+        return len(scan.photos), scan.total_bytes
+    
+    def _scan(self) -> _PhotoScan:
+        """
+        Scan the photos directory for photo files, shared by listing,
+        cleanup and storage totals
+        
+        The result is reused until the directory mtime changes, which
+        happens whenever a file is added or removed. Changes made through
+        this class also drop it, since mtime granularity can hide them.
+        
+        Returns:
+            _PhotoScan: Directory mtime, [(filename, stat)] and total bytes
+            
+        Raises:
+            FileNotFoundError: If the photos directory does not exist
+        """
+        photos_dir = self.config.photos_dir
+        dir_mtime = os.stat(photos_dir).st_mtime_ns
+        
+        cached = self._scan_cache
+        if cached is not None and cached.dir_mtime == dir_mtime:
+            return cached
+        
+        # One stat per entry, reusing the data scandir already has, with
+        # the total size accumulated in the same pass
+        photos = []
+        total_bytes = 0
+        with os.scandir(photos_dir) as entries:
+            for entry in entries:
+                if self._is_photo_file(entry.name):
+                    stat = entry.stat(follow_symlinks=False)
+                    photos.append((entry.name, stat))
+                    total_bytes += stat.st_size
+        
+        scan = _PhotoScan(dir_mtime, photos, total_bytes)
+        self._scan_cache = scan
+        return scan
+    
+    def _invalidate_scan(self):
+        """Drop the cached scan after this class added or removed a photo"""
+        self._scan_cache = None
+    
     def _is_photo_file(self, filename: str) -> bool:
         """Check if filename is a valid photo file"""
-        return filename.lower().endswith(('.jpg', '.jpeg', '.png'))
+        i = filename.rfind('.')
+        return i != -1 and filename[i:].lower() in _PHOTO_EXTS
     
     def _is_valid_filename(self, filename: str) -> bool:
         """Validate filename for security (prevent directory traversal)"""
-        if not filename:
-            return False
-        
-        # Prevent directory traversal attacks
-        if '..' in filename or '/' in filename or '\\' in filename:
-            return False
-        
-        # Must be a photo file
-        if not self._is_photo_file(filename):
-            return False
-        
-        return True
+        return _SAFE_FILENAME_RE.fullmatch(filename) is not None
 
 
 def get_photos_directory_size(photos_dir: str) -> Tuple[int, float]:
@@ -309,18 +514,18 @@ def get_photos_directory_size(photos_dir: str) -> Tuple[int, float]:
     Returns:
         Tuple[int, float]: (total_bytes, total_mb)
     """
-    if not os.path.exists(photos_dir):
-        return 0, 0.0
-    
     total_size = 0
     
     try:
-        for filename in os.listdir(photos_dir):
-            filepath = os.path.join(photos_dir, filename)
-            if os.path.isfile(filepath):
-                total_size += os.path.getsize(filepath)
+        with os.scandir(photos_dir) as entries:
+            total_size = sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in entries if entry.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        return 0, 0.0
     except Exception as e:
-        print(f"⚠️  Error calculating directory size: {e}")
+        logger.warning("⚠️  Error calculating directory size: %s", e)
     
     return total_size, round(total_size / (1024 * 1024), 2)
 
@@ -339,7 +544,10 @@ def validate_photos_directory(photos_dir: str) -> bool:
         # Create directory if it doesn't exist
         os.makedirs(photos_dir, exist_ok=True)
         
-        # Test write access
+        if os.access(photos_dir, os.W_OK | os.X_OK):
+            return True
+        
+        # os.access can be wrong on network filesystems, so confirm with a real write
         test_file = os.path.join(photos_dir, ".write_test")
         with open(test_file, 'w') as f:
             f.write("test")
@@ -350,5 +558,5 @@ def validate_photos_directory(photos_dir: str) -> bool:
         return True
         
     except Exception as e:
-        print(f"⚠️  Photos directory validation failed: {e}")
+        logger.warning("⚠️  Photos directory validation failed: %s", e)
         return False
@@ -5,15 +5,54 @@ Handles automatic recovery from system failures, camera timeouts,
 streaming issues, and other problems detected by the health monitor.
 """
 
+import bisect
+import logging
+import sys
 import time
 import threading
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Callable, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING, Deque, Dict, Any, Callable, List, Mapping, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
+from types import MappingProxyType
 
 from src.config import AppConfig
-from .health_monitor import HealthMetric
+from .timeutil import monotonic_to_iso
+
+if TYPE_CHECKING:
+    from .health_monitor import HealthMetric
+
+logger = logging.getLogger(__name__)
+
+
+# Delay after the first failed strategy, doubled per failure with progressive backoff
+_STRATEGY_BACKOFF_BASE = 0.25
+_STRATEGY_BACKOFF_MAX = 2.0
+
+# Window for attempt limits and recent recovery statistics
+_RECENT_WINDOW_SECONDS = 3600
+
+# Component each problem type's strategies act on; recovery is skipped while it is unset
+_REQUIRED_COMPONENT = MappingProxyType({
+    "camera_availability": "camera_manager",
+    "hardware_timeout": "camera_manager",
+    "frame_generation": "camera_manager",
+    "stream_quality": "camera_manager",
+    "session_management": "session_manager",
+    "streaming_performance": "camera_manager",
+})
+
+# Strategy outcome labels for recovery_actions, indexed by the strategy's bool result
+_RESULT_STR = ("failed", "success")
+
+# How often a quiesce wait re-checks its condition between teardown notifications
+_QUIESCE_POLL_INTERVAL = 0.1
+
+# Minimum time the camera hardware is left closed before it is reopened
+_CAMERA_SETTLE_SECONDS = 2.0
 
 
 class RecoveryResult(Enum):
@@ -25,20 +64,58 @@ class RecoveryResult(Enum):
     IN_PROGRESS = "in_progress"
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryOperation:
     """Recovery operation record"""
     name: str
     target: str  # What was being recovered
     result: RecoveryResult
-    started_at: datetime
-    completed_at: Optional[datetime] = None
+    started_at: float  # time.monotonic()
+    completed_at: Optional[float] = None
+    duration_seconds: Optional[float] = None
     error_message: Optional[str] = None
     recovery_actions: List[str] = field(default_factory=list)
+    result_str: str = field(init=False, default="")  # result.value, kept in step with result
     
     def __post_init__(self):
         if self.recovery_actions is None:
             self.recovery_actions = []
+        self.result_str = self.result.value
+    
+    def set_result(self, result: RecoveryResult):
+        """Set the result along with its serialized form"""
+        self.result = result
+        self.result_str = result.value
+    
+    def to_dict(self, mono_now: float, wall_now: datetime) -> Dict[str, Any]:
+        """Convert to dictionary, mapping monotonic timestamps onto wall_now"""
+        return {
+            "name": self.name,
+            "target": self.target,
+            "result": self.result_str,
+            "started_at": monotonic_to_iso(self.started_at, mono_now, wall_now),
+            "completed_at": (
+                monotonic_to_iso(self.completed_at, mono_now, wall_now)
+                if self.completed_at is not None else None
+            ),
+            "duration_seconds": self.duration_seconds,
+            "error_message": self.error_message,
+            "recovery_actions": self.recovery_actions
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class _RecoverySnapshot:
+    """Read-only copy of recovery state, replaced wholesale on every write"""
+    history: Tuple[RecoveryOperation, ...] = ()
+    history_dicts: Tuple[Dict[str, Any], ...] = ()  # history serialized when stored
+    attempts_by_type: Mapping[str, int] = field(default_factory=dict)
+    last_recovery_time: Mapping[str, float] = field(default_factory=dict)
+    # Last-hour window: sorted start times plus prefix counts, so
+    # recent_success[i] is the number of successes among the first i entries
+    recent_started: Tuple[float, ...] = ()
+    recent_success: Tuple[int, ...] = (0,)
+    recent_failed: Tuple[int, ...] = (0,)
 
 
 class RecoveryManager:
@@ -63,458 +140,604 @@ class RecoveryManager:
         self.health_monitor = None
         self.streaming_validator = None
         
+        # Component capabilities, probed once in set_component_references
+        self._cm_has_reset_adaptive = False
+        self._cm_has_force_quality = False
+        self._cm_has_force_frame_rate = False
+        self._cm_has_hardware_detector = False
+        self._cm_has_stream_output = False
+        self._cm_has_streaming_stats = False
+        self._cm_has_network_monitor = False
+        self._nm_has_reset_state = False
+        self._sm_has_stats = False
+        
         # Recovery configuration
         self.max_recovery_attempts = 3
         self.recovery_cooldown_seconds = 60  # Wait between recovery attempts
         self.progressive_backoff = True  # Increase delay with each attempt
         
         # Recovery state
-        self.recovery_history: List[RecoveryOperation] = []
         self.max_history_length = 50
-        self.recovery_lock = threading.RLock()
+        self.recovery_history: Deque[RecoveryOperation] = deque(maxlen=self.max_history_length)
+        self._history_dicts: Deque[Dict[str, Any]] = deque(maxlen=self.max_history_length)
         
-        # Attempt tracking
-        self.recovery_attempts: Dict[str, List[float]] = {}
+        # Sliding window of (started_at, result_str) for the last hour, kept sorted
+        self._recent_results: Deque[Tuple[float, str]] = deque()
+        self.recovery_lock = threading.RLock()  # Guards recovery state, held briefly
+        
+        # Attempt tracking (written under recovery_lock, read without it)
+        self.recovery_attempts: Dict[str, Deque[float]] = {}
         self.last_recovery_time: Dict[str, float] = {}
+        self._next_allowed: Dict[str, float] = {}  # Earliest monotonic time of the next attempt
+        
+        # Recovery worker, created on first accepted attempt
+        self._recovery_pool: Optional[ThreadPoolExecutor] = None
+        self._active_futures: Dict[str, Future] = {}
+        self._shut_down = False
+        
+        # Published under recovery_lock, read by status endpoints without it
+        self._snapshot = _RecoverySnapshot()
+        
+        # Set by the camera manager whenever streaming or the device is torn down
+        self._camera_quiesced = threading.Event()
         
         # Recovery strategies
-        self.recovery_strategies: Dict[str, List[Callable]] = {}
-        self._initialize_recovery_strategies()
+        self.recovery_strategies = self._initialize_recovery_strategies()
         
-        print("🔧 RecoveryManager initialized")
+        logger.info("🔧 RecoveryManager initialized")
     
     def set_component_references(self, camera_manager=None, session_manager=None, 
                                health_monitor=None, streaming_validator=None):
         """Set references to other system components"""
         if camera_manager:
             self.camera_manager = camera_manager
+            camera_manager.set_teardown_callback(self._camera_quiesced.set)
+            
+            self._cm_has_reset_adaptive = hasattr(camera_manager, 'reset_adaptive_settings')
+            self._cm_has_force_quality = hasattr(camera_manager, 'force_quality_change')
+            self._cm_has_force_frame_rate = hasattr(camera_manager, 'force_frame_rate_change')
+            self._cm_has_hardware_detector = hasattr(camera_manager, 'hardware_detector')
+            self._cm_has_stream_output = hasattr(camera_manager, 'stream_output')
+            self._cm_has_streaming_stats = hasattr(camera_manager, 'streaming_stats')
+            self._cm_has_network_monitor = hasattr(camera_manager, 'network_monitor')
+            self._nm_has_reset_state = (
+                self._cm_has_network_monitor and
+                hasattr(camera_manager.network_monitor, 'reset_monitoring_state')
+            )
         if session_manager:
             self.session_manager = session_manager
+            self._sm_has_stats = hasattr(session_manager, 'stats')
         if health_monitor:
             self.health_monitor = health_monitor
         if streaming_validator:
             self.streaming_validator = streaming_validator
     
-    def _initialize_recovery_strategies(self):
+    def _initialize_recovery_strategies(self) -> Mapping[str, Tuple[Callable[[], bool], ...]]:
         """Initialize recovery strategies for different types of problems"""
+        strategies: Dict[str, Tuple[Callable[[], bool], ...]] = {}
         
         # Camera hardware issues
-        self.recovery_strategies["camera_availability"] = [
+        strategies["camera_availability"] = (
             self._restart_camera_device,
             self._reinitialize_camera_system,
             self._reset_camera_configuration
-        ]
+        )
         
         # Hardware timeout issues
-        self.recovery_strategies["hardware_timeout"] = [
+        strategies["hardware_timeout"] = (
             self._reset_hardware_connection,
             self._restart_camera_device,
             self._force_camera_restart
-        ]
+        )
         
         # Frame generation issues
-        self.recovery_strategies["frame_generation"] = [
+        strategies["frame_generation"] = (
             self._restart_streaming,
             self._reset_frame_buffer,
             self._restart_camera_device
-        ]
+        )
         
         # Stream quality issues
-        self.recovery_strategies["stream_quality"] = [
+        strategies["stream_quality"] = (
             self._reduce_stream_quality,
             self._restart_streaming,
             self._reset_adaptive_settings
-        ]
+        )
         
         # Session management issues
-        self.recovery_strategies["session_management"] = [
+        strategies["session_management"] = (
             self._cleanup_expired_sessions,
             self._reset_session_state,
             self._restart_session_manager
-        ]
+        )
         
         # Streaming performance issues
-        self.recovery_strategies["streaming_performance"] = [
+        strategies["streaming_performance"] = (
             self._optimize_streaming_settings,
             self._restart_streaming,
             self._reset_network_monitoring
-        ]
+        )
+        
+        # Built once and never mutated, so readers need no lock
+        return MappingProxyType(strategies)
     
-    def attempt_recovery(self, problem_type: str, metric: HealthMetric) -> bool:
+    def attempt_recovery(self, problem_type: str, metric: Optional["HealthMetric"] = None) -> Optional[Future]:
         """
         Attempt recovery for a specific problem
         
+        Cooldowns and attempt limits are checked on the calling thread; an
+        accepted recovery runs its strategies on the recovery worker.
+        
         Args:
             problem_type: Type of problem to recover from
-            metric: Health metric that triggered recovery
+            metric: Health metric that triggered recovery, if any
             
         Returns:
-            bool: True if recovery was successful
+            Optional[Future]: Resolves to True if recovery was successful,
+            or None if the attempt was rejected
         """
+        current_time = time.monotonic()
+        problem_type = sys.intern(problem_type)  # Reused as a key in every tracking dict
+        
+        # Fast path: reject during cooldown without taking the lock
+        next_allowed = self._next_allowed.get(problem_type)
+        if next_allowed is not None and current_time < next_allowed:
+            logger.info("🕒 Recovery on hold for %s: %.1fs remaining", problem_type, next_allowed - current_time)
+            return None
+        
         with self.recovery_lock:
-            current_time = time.time()
-            
-            # Check recovery cooldown
-            if problem_type in self.last_recovery_time:
-                time_since_last = current_time - self.last_recovery_time[problem_type]
-                if time_since_last < self.recovery_cooldown_seconds:
-                    print(f"🕒 Recovery cooldown active for {problem_type}: {time_since_last:.1f}s ago")
-                    return False
+            if self._shut_down:
+                return None
+            
+            # Never queue a second recovery while one for this problem is pending
+            active = self._active_futures.get(problem_type)
+            if active is not None and not active.done():
+                logger.info("🕒 Recovery already in progress for %s", problem_type)
+                return None
+            
+            # Check again, another thread may have just claimed it
+            current_time = time.monotonic()
+            next_allowed = self._next_allowed.get(problem_type)
+            if next_allowed is not None and current_time < next_allowed:
+                logger.info("🕒 Recovery on hold for %s: %.1fs remaining", problem_type, next_allowed - current_time)
+                return None
             
             # Check maximum attempts
-            if problem_type not in self.recovery_attempts:
-                self.recovery_attempts[problem_type] = []
+            attempts = self.recovery_attempts.setdefault(
+                problem_type, deque(maxlen=self.max_recovery_attempts)
+            )
             
             # Clean old attempts (last hour)
-            cutoff_time = current_time - 3600
-            self.recovery_attempts[problem_type] = [
-                attempt for attempt in self.recovery_attempts[problem_type]
-                if attempt > cutoff_time
-            ]
-            
-            if len(self.recovery_attempts[problem_type]) >= self.max_recovery_attempts:
-                print(f"🚫 Maximum recovery attempts reached for {problem_type}")
-                return False
+            cutoff_time = current_time - _RECENT_WINDOW_SECONDS
+            while attempts and attempts[0] <= cutoff_time:
+                attempts.popleft()
+            
+            if len(attempts) >= attempts.maxlen:
+                # Hold further calls until the oldest attempt leaves the window
+                self._next_allowed[problem_type] = attempts[0] + _RECENT_WINDOW_SECONDS
+                logger.warning("🚫 Maximum recovery attempts reached for %s", problem_type)
+                return None
             
             # Record recovery attempt
-            self.recovery_attempts[problem_type].append(current_time)
+            attempts.append(current_time)
             self.last_recovery_time[problem_type] = current_time
+            self._next_allowed[problem_type] = current_time + self.recovery_cooldown_seconds
+            self._publish_snapshot(current_time)
+            
+            # A single worker keeps recoveries running one at a time
+            if self._recovery_pool is None:
+                self._recovery_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recovery")
+            future = self._recovery_pool.submit(self._run_recovery, problem_type, current_time)
+            self._active_futures[problem_type] = future
+        
+        return future
+    
+    def _run_recovery(self, problem_type: str, started_at: float) -> bool:
+        """Run the recovery strategies for a claimed attempt and record the outcome"""
+        operation = RecoveryOperation(
+            name=f"recovery_{problem_type}_{int(time.time())}",
+            target=problem_type,
+            result=RecoveryResult.IN_PROGRESS,
+            started_at=started_at
+        )
+        
+        logger.info("🔧 Starting recovery for: %s", problem_type)
+        
+        try:
+            # Execute recovery strategies
+            recovery_success = self._execute_recovery_strategies(problem_type, operation)
+            
+            # Update operation result
+            operation.completed_at = time.monotonic()
+            operation.duration_seconds = operation.completed_at - operation.started_at
+            if recovery_success:
+                operation.set_result(RecoveryResult.SUCCESS)
+                logger.info("✅ Recovery successful for: %s", problem_type)
+            else:
+                operation.set_result(RecoveryResult.FAILED)
+                logger.warning("❌ Recovery failed for: %s", problem_type)
             
-            # Start recovery operation
-            operation = RecoveryOperation(
-                name=f"recovery_{problem_type}_{int(current_time)}",
-                target=problem_type,
-                result=RecoveryResult.IN_PROGRESS,
-                started_at=datetime.now()
-            )
+            # Store in history
+            self._store_recovery_operation(operation)
             
-            print(f"🔧 Starting recovery for: {problem_type}")
+            return recovery_success
             
-            try:
-                # Execute recovery strategies
-                recovery_success = self._execute_recovery_strategies(problem_type, operation)
-                
-                # Update operation result
-                operation.completed_at = datetime.now()
-                if recovery_success:
-                    operation.result = RecoveryResult.SUCCESS
-                    print(f"✅ Recovery successful for: {problem_type}")
-                else:
-                    operation.result = RecoveryResult.FAILED
-                    print(f"❌ Recovery failed for: {problem_type}")
-                
-                # Store in history
-                self._store_recovery_operation(operation)
-                
-                return recovery_success
-                
-            except Exception as e:
-                operation.completed_at = datetime.now()
-                operation.result = RecoveryResult.FAILED
-                operation.error_message = str(e)
-                self._store_recovery_operation(operation)
-                
-                print(f"❌ Recovery exception for {problem_type}: {e}")
-                return False
+        except Exception as e:
+            operation.completed_at = time.monotonic()
+            operation.duration_seconds = operation.completed_at - operation.started_at
+            operation.set_result(RecoveryResult.FAILED)
+            operation.error_message = str(e)
+            self._store_recovery_operation(operation)
+            
+            logger.error("❌ Recovery exception for %s: %s", problem_type, e)
+            return False
     
     def _execute_recovery_strategies(self, problem_type: str, operation: RecoveryOperation) -> bool:
         """Execute recovery strategies for a problem type"""
-        strategies = self.recovery_strategies.get(problem_type, [])
+        strategies = self.recovery_strategies.get(problem_type, ())
         
         if not strategies:
-            print(f"⚠️ No recovery strategies defined for: {problem_type}")
+            logger.warning("⚠️ No recovery strategies defined for: %s", problem_type)
+            return False
+        
+        required = _REQUIRED_COMPONENT.get(problem_type)
+        if required and getattr(self, required) is None:
+            logger.warning("⚠️ Skipping recovery for %s: %s not available", problem_type, required)
             return False
         
+        failures = 0
+        count = len(strategies)
         for i, strategy in enumerate(strategies):
+            name = strategy.__name__
             try:
-                print(f"🔧 Executing recovery strategy {i+1}/{len(strategies)}: {strategy.__name__}")
+                logger.info("🔧 Executing recovery strategy %d/%d: %s", i + 1, count, name)
                 
-                success = strategy()
-                operation.recovery_actions.append(f"{strategy.__name__}: {'success' if success else 'failed'}")
+                success = bool(strategy())
+                operation.recovery_actions.append(f"{name}: {_RESULT_STR[success]}")
                 
                 if success:
-                    print(f"✅ Recovery strategy succeeded: {strategy.__name__}")
+                    logger.info("✅ Recovery strategy succeeded: %s", name)
                     return True
                 else:
-                    print(f"❌ Recovery strategy failed: {strategy.__name__}")
-                    
-                # Brief pause between strategies
-                time.sleep(2.0)
+                    logger.warning("❌ Recovery strategy failed: %s", name)
+                
+                # Back off before the next strategy, longer after each failure
+                if i < count - 1:
+                    failures += 1
+                    delay = _STRATEGY_BACKOFF_BASE
+                    if self.progressive_backoff:
+                        delay *= 2 ** (failures - 1)
+                    time.sleep(min(delay, _STRATEGY_BACKOFF_MAX))
                 
             except Exception as e:
-                error_msg = f"{strategy.__name__}: error - {str(e)}"
+                error_msg = f"{name}: error - {e}"
                 operation.recovery_actions.append(error_msg)
-                print(f"❌ Recovery strategy exception: {error_msg}")
+                logger.error("❌ Recovery strategy exception: %s", error_msg)
         
-        print(f"❌ All recovery strategies failed for: {problem_type}")
+        logger.warning("❌ All recovery strategies failed for: %s", problem_type)
         return False
     
+    def _wait_until(self, condition: Callable[[], bool], timeout: float) -> bool:
+        """
+        Wait until a condition holds, re-checking whenever the camera reports teardown
+        
+        Args:
+            condition: Callable returning True once the subsystem is quiescent
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            bool: True if the condition held before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._camera_quiesced.wait(min(remaining, _QUIESCE_POLL_INTERVAL))
+            self._camera_quiesced.clear()
+        return True
+    
+    def _wait_for_camera_release(self, timeout: float, settle: float = _CAMERA_SETTLE_SECONDS) -> bool:
+        """
+        Wait until the camera device is released, then let the hardware settle
+        
+        Closing the device is synchronous, so the release itself says nothing
+        about the hardware; the settle time gives the sensor and driver time
+        to reset before the camera is reopened.
+        
+        Args:
+            timeout: Maximum time to wait for the release in seconds
+            settle: Time to wait once the camera is released
+            
+        Returns:
+            bool: True if the camera was released before the timeout
+        """
+        if not self._wait_until(self._camera_released, timeout):
+            return False
+        
+        time.sleep(settle)
+        return True
+    
+    def _camera_stopped(self) -> bool:
+        return not self.camera_manager.is_streaming
+    
+    def _camera_released(self) -> bool:
+        return self.camera_manager.camera_device is None
+    
     # Recovery Strategy Implementations
     
     def _restart_camera_device(self) -> bool:
         """Restart camera device"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Restarting camera device...")
+            logger.info("🔄 Restarting camera device...")
             
             # Stop streaming if active
-            if self.camera_manager.is_streaming:
-                self.camera_manager.stop_streaming()
-                time.sleep(2.0)
+            if cm.is_streaming:
+                cm.stop_streaming()
+                self._wait_until(self._camera_stopped, timeout=2.0)
             
             # Cleanup current camera
-            self.camera_manager.cleanup()
-            time.sleep(3.0)
+            cm.cleanup()
+            self._wait_for_camera_release(timeout=3.0)
             
             # Reinitialize camera
-            success = self.camera_manager.init_camera()
+            success = cm.init_camera()
             
             if success:
-                print("✅ Camera device restarted successfully")
+                logger.info("✅ Camera device restarted successfully")
                 return True
             else:
-                print("❌ Camera device restart failed")
+                logger.warning("❌ Camera device restart failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Camera restart exception: {e}")
+            logger.error("❌ Camera restart exception: %s", e)
             return False
     
     def _reinitialize_camera_system(self) -> bool:
         """Reinitialize entire camera system"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Reinitializing camera system...")
+            logger.info("🔄 Reinitializing camera system...")
             
             # Full cleanup
-            self.camera_manager.cleanup()
-            time.sleep(5.0)
+            cm.cleanup()
+            self._wait_for_camera_release(timeout=5.0)
             
             # Reset adaptive settings
-            if hasattr(self.camera_manager, 'reset_adaptive_settings'):
-                self.camera_manager.reset_adaptive_settings()
+            if self._cm_has_reset_adaptive:
+                cm.reset_adaptive_settings()
             
             # Reinitialize
-            success = self.camera_manager.init_camera()
+            success = cm.init_camera()
             
             if success:
-                print("✅ Camera system reinitialized successfully")
+                logger.info("✅ Camera system reinitialized successfully")
                 return True
             else:
-                print("❌ Camera system reinitialization failed")
+                logger.warning("❌ Camera system reinitialization failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Camera system reinitialization exception: {e}")
+            logger.error("❌ Camera system reinitialization exception: %s", e)
             return False
     
     def _reset_camera_configuration(self) -> bool:
         """Reset camera configuration to defaults"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Resetting camera configuration...")
+            logger.info("🔄 Resetting camera configuration...")
             
             # Reset hardware detector
-            if hasattr(self.camera_manager, 'hardware_detector'):
-                self.camera_manager.hardware_detector.sensor_resolution = None
-                self.camera_manager.hardware_detector.camera_module = "unknown"
+            if self._cm_has_hardware_detector:
+                cm.hardware_detector.reset_detection()
             
             # Cleanup and reinitialize
-            self.camera_manager.cleanup()
-            time.sleep(3.0)
+            cm.cleanup()
+            self._wait_for_camera_release(timeout=3.0)
             
-            success = self.camera_manager.init_camera()
+            success = cm.init_camera()
             
             if success:
-                print("✅ Camera configuration reset successfully")
+                logger.info("✅ Camera configuration reset successfully")
                 return True
             else:
-                print("❌ Camera configuration reset failed")
+                logger.warning("❌ Camera configuration reset failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Camera configuration reset exception: {e}")
+            logger.error("❌ Camera configuration reset exception: %s", e)
             return False
     
     def _reset_hardware_connection(self) -> bool:
         """Reset hardware connection"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Resetting hardware connection...")
+            logger.info("🔄 Resetting hardware connection...")
             
             # Stop all camera operations
-            if self.camera_manager.is_streaming:
-                self.camera_manager.stop_streaming()
+            if cm.is_streaming:
+                cm.stop_streaming()
             
             # Close camera device
-            if self.camera_manager.camera_device:
+            if cm.camera_device:
                 try:
-                    self.camera_manager.camera_device.stop()
-                    self.camera_manager.camera_device.close()
+                    cm.camera_device.stop()
+                    cm.camera_device.close()
                 except:
                     pass
-                self.camera_manager.camera_device = None
+                cm.camera_device = None
             
             # Wait for hardware to reset
-            time.sleep(5.0)
+            self._wait_for_camera_release(timeout=5.0)
             
             # Reinitialize
-            success = self.camera_manager.init_camera()
+            success = cm.init_camera()
             
             if success:
-                print("✅ Hardware connection reset successfully")
+                logger.info("✅ Hardware connection reset successfully")
                 return True
             else:
-                print("❌ Hardware connection reset failed")
+                logger.warning("❌ Hardware connection reset failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Hardware connection reset exception: {e}")
+            logger.error("❌ Hardware connection reset exception: %s", e)
             return False
     
     def _force_camera_restart(self) -> bool:
         """Force camera restart with aggressive cleanup"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Force restarting camera...")
+            logger.info("🔄 Force restarting camera...")
             
             # Aggressive cleanup
             try:
-                if self.camera_manager.is_streaming:
-                    self.camera_manager.stop_streaming()
+                if cm.is_streaming:
+                    cm.stop_streaming()
                 
-                if self.camera_manager.camera_device:
-                    self.camera_manager.camera_device.stop()
-                    self.camera_manager.camera_device.close()
+                if cm.camera_device:
+                    cm.camera_device.stop()
+                    cm.camera_device.close()
                     
-                self.camera_manager.camera_device = None
-                self.camera_manager.is_streaming = False
+                cm.camera_device = None
+                cm.is_streaming = False
                 
             except Exception as e:
-                print(f"⚠️ Cleanup exception (continuing): {e}")
+                logger.warning("⚠️ Cleanup exception (continuing): %s", e)
             
             # Extended wait
-            time.sleep(10.0)
+            self._wait_for_camera_release(timeout=10.0, settle=2 * _CAMERA_SETTLE_SECONDS)
             
             # Try minimal initialization
-            success = self.camera_manager.init_camera()
+            success = cm.init_camera()
             
             if success:
-                print("✅ Force camera restart successful")
+                logger.info("✅ Force camera restart successful")
                 return True
             else:
-                print("❌ Force camera restart failed")
+                logger.warning("❌ Force camera restart failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Force camera restart exception: {e}")
+            logger.error("❌ Force camera restart exception: %s", e)
             return False
     
     def _restart_streaming(self) -> bool:
         """Restart streaming"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Restarting streaming...")
+            logger.info("🔄 Restarting streaming...")
             
             # Stop current streaming
-            if self.camera_manager.is_streaming:
-                self.camera_manager.stop_streaming()
-                time.sleep(3.0)
+            if cm.is_streaming:
+                cm.stop_streaming()
+                self._wait_until(self._camera_stopped, timeout=3.0)
             
             # Start streaming again
-            success = self.camera_manager.setup_streaming()
+            success = cm.setup_streaming()
             
             if success:
-                print("✅ Streaming restarted successfully")
+                logger.info("✅ Streaming restarted successfully")
                 return True
             else:
-                print("❌ Streaming restart failed")
+                logger.warning("❌ Streaming restart failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Streaming restart exception: {e}")
+            logger.error("❌ Streaming restart exception: %s", e)
             return False
     
     def _reset_frame_buffer(self) -> bool:
         """Reset frame buffer"""
         try:
-            if not self.camera_manager or not hasattr(self.camera_manager, 'stream_output'):
+            cm = self.camera_manager
+            if not cm or not self._cm_has_stream_output:
                 return False
             
-            print("🔄 Resetting frame buffer...")
+            logger.info("🔄 Resetting frame buffer...")
             
             # Reset stream output metrics
-            if self.camera_manager.stream_output:
-                self.camera_manager.stream_output.reset_performance_counters()
+            if cm.stream_output:
+                cm.stream_output.reset_performance_counters()
             
             # Reset streaming stats
-            if hasattr(self.camera_manager, 'streaming_stats'):
+            if self._cm_has_streaming_stats:
                 # Reset streaming statistics
                 pass
             
-            print("✅ Frame buffer reset successfully")
+            logger.info("✅ Frame buffer reset successfully")
             return True
                 
         except Exception as e:
-            print(f"❌ Frame buffer reset exception: {e}")
+            logger.error("❌ Frame buffer reset exception: %s", e)
             return False
     
     def _reduce_stream_quality(self) -> bool:
         """Reduce stream quality to improve performance"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Reducing stream quality...")
+            logger.info("🔄 Reducing stream quality...")
             
             # Try to reduce quality
-            if hasattr(self.camera_manager, 'force_quality_change'):
+            if self._cm_has_force_quality:
                 # Reduce quality by 20%
-                current_quality = getattr(self.camera_manager.quality_adapter, 'current_quality', 85)
+                current_quality = getattr(cm.quality_adapter, 'current_quality', 85)
                 new_quality = max(30, int(current_quality * 0.8))
-                success = self.camera_manager.force_quality_change(new_quality)
+                success = cm.force_quality_change(new_quality)
                 
                 if success:
-                    print(f"✅ Stream quality reduced to {new_quality}%")
+                    logger.info("✅ Stream quality reduced to %s%%", new_quality)
                     return True
             
-            print("❌ Stream quality reduction failed")
+            logger.warning("❌ Stream quality reduction failed")
             return False
                 
         except Exception as e:
-            print(f"❌ Stream quality reduction exception: {e}")
+            logger.error("❌ Stream quality reduction exception: %s", e)
             return False
     
     def _reset_adaptive_settings(self) -> bool:
         """Reset adaptive streaming settings"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Resetting adaptive settings...")
+            logger.info("🔄 Resetting adaptive settings...")
             
-            if hasattr(self.camera_manager, 'reset_adaptive_settings'):
-                self.camera_manager.reset_adaptive_settings()
-                print("✅ Adaptive settings reset successfully")
+            if self._cm_has_reset_adaptive:
+                cm.reset_adaptive_settings()
+                logger.info("✅ Adaptive settings reset successfully")
                 return True
             
-            print("❌ Adaptive settings reset not available")
+            logger.warning("❌ Adaptive settings reset not available")
             return False
                 
         except Exception as e:
-            print(f"❌ Adaptive settings reset exception: {e}")
+            logger.error("❌ Adaptive settings reset exception: %s", e)
             return False
     
     def _cleanup_expired_sessions(self) -> bool:
@@ -523,19 +746,19 @@ class RecoveryManager:
             if not self.session_manager:
                 return False
             
-            print("🔄 Cleaning up expired sessions...")
+            logger.info("🔄 Cleaning up expired sessions...")
             
             result = self.session_manager.force_cleanup()
             
             if result["sessions_removed"] > 0 or result["ips_unblocked"] > 0:
-                print(f"✅ Session cleanup successful: {result}")
+                logger.info("✅ Session cleanup successful: %s", result)
                 return True
             else:
-                print("✅ Session cleanup completed (no items removed)")
+                logger.info("✅ Session cleanup completed (no items removed)")
                 return True
                 
         except Exception as e:
-            print(f"❌ Session cleanup exception: {e}")
+            logger.error("❌ Session cleanup exception: %s", e)
             return False
     
     def _reset_session_state(self) -> bool:
@@ -544,21 +767,21 @@ class RecoveryManager:
             if not self.session_manager:
                 return False
             
-            print("🔄 Resetting session state...")
+            logger.info("🔄 Resetting session state...")
             
             # Reset statistics
-            if hasattr(self.session_manager, 'stats'):
+            if self._sm_has_stats:
                 self.session_manager.stats["validation_failures"] = 0
             
             # Clear failed attempts for all IPs
             self.session_manager.failed_attempts.clear()
             self.session_manager.blocked_ips.clear()
             
-            print("✅ Session state reset successfully")
+            logger.info("✅ Session state reset successfully")
             return True
                 
         except Exception as e:
-            print(f"❌ Session state reset exception: {e}")
+            logger.error("❌ Session state reset exception: %s", e)
             return False
     
     def _restart_session_manager(self) -> bool:
@@ -567,109 +790,146 @@ class RecoveryManager:
             if not self.session_manager:
                 return False
             
-            print("🔄 Restarting session manager...")
+            logger.info("🔄 Restarting session manager...")
             
             # Stop cleanup service
             self.session_manager.stop_cleanup_service()
-            time.sleep(2.0)
+            cleanup_thread = self.session_manager.cleanup_thread
+            self._wait_until(lambda: not (cleanup_thread and cleanup_thread.is_alive()), timeout=2.0)
             
             # Start cleanup service
             self.session_manager.start_cleanup_service()
             
-            print("✅ Session manager restarted successfully")
+            logger.info("✅ Session manager restarted successfully")
             return True
                 
         except Exception as e:
-            print(f"❌ Session manager restart exception: {e}")
+            logger.error("❌ Session manager restart exception: %s", e)
             return False
     
     def _optimize_streaming_settings(self) -> bool:
         """Optimize streaming settings for better performance"""
         try:
-            if not self.camera_manager:
+            cm = self.camera_manager
+            if not cm:
                 return False
             
-            print("🔄 Optimizing streaming settings...")
+            logger.info("🔄 Optimizing streaming settings...")
             
             # Reduce frame rate if high
-            if hasattr(self.camera_manager, 'force_frame_rate_change'):
-                current_fps = getattr(self.camera_manager.quality_adapter, 'current_frame_rate', 30)
+            if self._cm_has_force_frame_rate:
+                current_fps = getattr(cm.quality_adapter, 'current_frame_rate', 30)
                 if current_fps > 15:
                     new_fps = max(10, int(current_fps * 0.7))
-                    self.camera_manager.force_frame_rate_change(new_fps)
-                    print(f"📊 Frame rate reduced to {new_fps} fps")
+                    cm.force_frame_rate_change(new_fps)
+                    logger.info("📊 Frame rate reduced to %s fps", new_fps)
             
             # Reduce quality if high
-            if hasattr(self.camera_manager, 'force_quality_change'):
-                current_quality = getattr(self.camera_manager.quality_adapter, 'current_quality', 85)
+            if self._cm_has_force_quality:
+                current_quality = getattr(cm.quality_adapter, 'current_quality', 85)
                 if current_quality > 60:
                     new_quality = max(50, int(current_quality * 0.8))
-                    self.camera_manager.force_quality_change(new_quality)
-                    print(f"📊 Quality reduced to {new_quality}%")
+                    cm.force_quality_change(new_quality)
+                    logger.info("📊 Quality reduced to %s%%", new_quality)
             
-            print("✅ Streaming settings optimized")
+            logger.info("✅ Streaming settings optimized")
             return True
                 
         except Exception as e:
-            print(f"❌ Streaming optimization exception: {e}")
+            logger.error("❌ Streaming optimization exception: %s", e)
             return False
     
     def _reset_network_monitoring(self) -> bool:
         """Reset network monitoring"""
         try:
-            if not self.camera_manager or not hasattr(self.camera_manager, 'network_monitor'):
+            cm = self.camera_manager
+            if not cm or not self._cm_has_network_monitor:
                 return False
             
-            print("🔄 Resetting network monitoring...")
+            logger.info("🔄 Resetting network monitoring...")
             
             # Reset network monitor
-            network_monitor = self.camera_manager.network_monitor
-            if hasattr(network_monitor, 'reset_monitoring_state'):
+            network_monitor = cm.network_monitor
+            if self._nm_has_reset_state:
                 network_monitor.reset_monitoring_state()
             
-            print("✅ Network monitoring reset successfully")
+            logger.info("✅ Network monitoring reset successfully")
             return True
                 
         except Exception as e:
-            print(f"❌ Network monitoring reset exception: {e}")
+            logger.error("❌ Network monitoring reset exception: %s", e)
             return False
     
     def _store_recovery_operation(self, operation: RecoveryOperation):
         """Store recovery operation in history"""
-        self.recovery_history.append(operation)
+        serialized = operation.to_dict(time.monotonic(), datetime.now())
+        with self.recovery_lock:
+            self.recovery_history.append(operation)
+            self._history_dicts.append(serialized)
+            # Keep the window sorted by start time whatever order operations finish in
+            bisect.insort(self._recent_results, (operation.started_at, operation.result_str))
+            self._publish_snapshot(time.monotonic())
+    
+    def _publish_snapshot(self, current_time: float):
+        """Age out expired state and publish a fresh snapshot (recovery_lock held)"""
+        # Drop operations that left the last hour
+        recent = self._recent_results
+        cutoff_time = current_time - _RECENT_WINDOW_SECONDS
+        while recent and recent[0][0] <= cutoff_time:
+            recent.popleft()
         
-        # Keep only recent history
-        if len(self.recovery_history) > self.max_history_length:
-            self.recovery_history.pop(0)
+        # Drop problem types whose cooldown has passed
+        expired = [
+            problem_type for problem_type, last_time in self.last_recovery_time.items()
+            if current_time - last_time >= self.recovery_cooldown_seconds
+        ]
+        for problem_type in expired:
+            del self.last_recovery_time[problem_type]
+        expired = [
+            problem_type for problem_type, next_allowed in self._next_allowed.items()
+            if current_time >= next_allowed
+        ]
+        for problem_type in expired:
+            del self._next_allowed[problem_type]
+        
+        self._snapshot = _RecoverySnapshot(
+            history=tuple(self.recovery_history),
+            history_dicts=tuple(self._history_dicts),
+            attempts_by_type={
+                problem_type: len(attempts)
+                for problem_type, attempts in self.recovery_attempts.items()
+            },
+            last_recovery_time=dict(self.last_recovery_time),
+            recent_started=tuple(started_at for started_at, _ in recent),
+            recent_success=tuple(accumulate((result == "success" for _, result in recent), initial=0)),
+            recent_failed=tuple(accumulate((result == "failed" for _, result in recent), initial=0))
+        )
     
     def get_recovery_status(self) -> Dict[str, Any]:
         """Get recovery manager status"""
-        current_time = time.time()
+        current_time = time.monotonic()
+        snap = self._snapshot
         
-        # Calculate recovery statistics
-        recent_operations = [
-            op for op in self.recovery_history
-            if (datetime.now() - op.started_at).total_seconds() < 3600  # Last hour
-        ]
+        # Skip operations that left the last hour since the snapshot was taken
+        first = bisect.bisect_right(snap.recent_started, current_time - _RECENT_WINDOW_SECONDS)
+        recent_count = len(snap.recent_started) - first
+        successful_recoveries = snap.recent_success[-1] - snap.recent_success[first]
+        failed_recoveries = snap.recent_failed[-1] - snap.recent_failed[first]
         
-        successful_recoveries = len([op for op in recent_operations if op.result == RecoveryResult.SUCCESS])
-        failed_recoveries = len([op for op in recent_operations if op.result == RecoveryResult.FAILED])
+        active_cooldowns = {}
+        for problem_type, last_time in snap.last_recovery_time.items():
+            remaining = self.recovery_cooldown_seconds - (current_time - last_time)
+            if remaining > 0:
+                active_cooldowns[problem_type] = remaining
         
         return {
-            "total_recovery_operations": len(self.recovery_history),
-            "recent_operations_count": len(recent_operations),
+            "total_recovery_operations": len(snap.history),
+            "recent_operations_count": recent_count,
             "recent_successful_recoveries": successful_recoveries,
             "recent_failed_recoveries": failed_recoveries,
-            "success_rate": successful_recoveries / max(len(recent_operations), 1),
-            "active_cooldowns": {
-                problem_type: self.recovery_cooldown_seconds - (current_time - last_time)
-                for problem_type, last_time in self.last_recovery_time.items()
-                if current_time - last_time < self.recovery_cooldown_seconds
-            },
-            "recovery_attempts_by_type": {
-                problem_type: len(attempts)
-                for problem_type, attempts in self.recovery_attempts.items()
-            },
+            "success_rate": successful_recoveries / max(recent_count, 1),
+            "active_cooldowns": active_cooldowns,
+            "recovery_attempts_by_type": dict(snap.attempts_by_type),
             "configuration": {
                 "max_recovery_attempts": self.max_recovery_attempts,
                 "recovery_cooldown_seconds": self.recovery_cooldown_seconds,
@@ -680,46 +940,43 @@ class RecoveryManager:
     
     def get_recovery_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent recovery history"""
-        recent_history = self.recovery_history[-limit:] if limit > 0 else self.recovery_history
-        
-        return [
-            {
-                "name": op.name,
-                "target": op.target,
-                "result": op.result.value,
-                "started_at": op.started_at.isoformat(),
-                "completed_at": op.completed_at.isoformat() if op.completed_at else None,
-                "duration_seconds": (op.completed_at - op.started_at).total_seconds() if op.completed_at else None,
-                "error_message": op.error_message,
-                "recovery_actions": op.recovery_actions
-            }
-            for op in reversed(recent_history)
-        ]
+        history = self._snapshot.history_dicts
+        recent_history = history[-limit:] if limit > 0 else history
+        return list(reversed(recent_history))
     
     def force_recovery(self, problem_type: str) -> bool:
         """Force recovery for a specific problem type (bypass cooldowns)"""
-        print(f"🚨 Forcing recovery for: {problem_type}")
+        logger.warning("🚨 Forcing recovery for: %s", problem_type)
         
         # Temporarily clear cooldown
-        if problem_type in self.last_recovery_time:
-            del self.last_recovery_time[problem_type]
+        with self.recovery_lock:
+            self.last_recovery_time.pop(problem_type, None)
+            self._next_allowed.pop(problem_type, None)
+            self._publish_snapshot(time.monotonic())
         
-        # Create dummy metric for recovery
-        from .health_monitor import HealthMetric, HealthStatus
-        dummy_metric = HealthMetric(
-            name=problem_type,
-            status=HealthStatus.CRITICAL,
-            value=True,
-            message="Forced recovery",
-            last_updated=datetime.now()
-        )
+        # Wait for the outcome, callers of a forced recovery report it
+        future = self.attempt_recovery(problem_type)
+        return future.result() if future is not None else False
+    
+    def shutdown(self, wait: bool = True):
+        """Stop accepting recoveries and shut down the recovery worker"""
+        with self.recovery_lock:
+            self._shut_down = True
+            pool = self._recovery_pool
+            self._recovery_pool = None
         
-        return self.attempt_recovery(problem_type, dummy_metric)
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            logger.info("🔧 Recovery worker stopped")
     
     def reset_recovery_state(self):
         """Reset recovery manager state"""
         with self.recovery_lock:
             self.recovery_attempts.clear()
             self.last_recovery_time.clear()
+            self._next_allowed.clear()
             self.recovery_history.clear()
-            print("🔧 Recovery manager state reset")
+            self._history_dicts.clear()
+            self._recent_results.clear()
+            self._snapshot = _RecoverySnapshot()
+            logger.info("🔧 Recovery manager state reset")
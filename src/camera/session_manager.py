@@ -5,27 +5,120 @@ Handles secure session management with automatic cleanup, validation,
 and recovery mechanisms to prevent 401 authentication errors.
 """
 
+import heapq
 import time
 import threading
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Set, List
-from dataclasses import dataclass
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Deque, Dict, Any, Iterator, Set, List, Tuple
+from dataclasses import dataclass, field
+
+try:
+    from fastrlock.rlock import FastRLock as _RLock  # type: ignore
+except ImportError:
+    from threading import RLock as _RLock
 
 from src.config import AppConfig
+from .timeutil import monotonic_to_iso
+
+# Sessions are split by token hash into this many independently locked shards
+_SHARD_COUNT = 16  # Power of two
+_SHARD_MASK = _SHARD_COUNT - 1
+
+# Per-thread cache of recent validations, so repeated checks of one token
+# within a request skip the shard lock
+_VALIDATION_CACHE_TTL = 1.0  # seconds
+_VALIDATION_CACHE_MAX = 64  # tokens per thread before the cache is reset
+
+# Shortest wait between cleanup passes, so near-simultaneous deadlines are batched
+_CLEANUP_MIN_WAIT = 1.0  # seconds
 
 
 @dataclass
 class SessionData:
     """Session data structure"""
     user_id: str
-    created: datetime
-    expires: datetime
-    last_access: datetime
+    token: str = field(repr=False)
+    created: float  # time.monotonic()
+    expires: float
+    last_access: float
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
     access_count: int = 0
-    is_active: bool = True
+    # Deadline of this session's live entry in the expiry heap
+    index_deadline: Optional[float] = field(default=None, init=False, repr=False)
+
+
+class _RWLock:
+    """
+    Readers-writer lock: many concurrent readers or one writer
+    
+    Waiting writers block new readers so a steady stream of validations cannot
+    starve them. The write side is reentrant, and the writing thread may also
+    take the read side. Readers must not upgrade to writing.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+    
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared"""
+        if self._writer == threading.get_ident():
+            yield
+            return
+        
+        with self._cond:
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+    
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively"""
+        ident = threading.get_ident()
+        with self._cond:
+            if self._writer != ident:
+                self._writers_waiting += 1
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+                self._writers_waiting -= 1
+                self._writer = ident
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+@dataclass
+class _SessionShard:
+    """One stripe of the session store, guarded by its own lock"""
+    sessions: Dict[str, SessionData] = field(default_factory=dict)
+    by_user: Dict[str, Set[str]] = field(default_factory=dict)  # user_id -> tokens
+    # Min-heap of (deadline, token), deadline being the earlier of expiry and
+    # inactivity timeout when pushed. Entries go stale when a session is removed
+    # or re-indexed and are skipped when popped.
+    expiry_heap: List[Tuple[float, str]] = field(default_factory=list)
+    active_count: int = 0
+    lock: _RWLock = field(default_factory=_RWLock)  # Shared for validation and reporting
 
 
 class SessionManager:
@@ -44,33 +137,42 @@ class SessionManager:
     def __init__(self, config: AppConfig):
         self.config = config
         
-        # Session storage
-        self.sessions: Dict[str, SessionData] = {}
-        self.session_lock = threading.RLock()
+        # Session storage; invalidated sessions are removed, so every entry is live
+        self._shards = [_SessionShard() for _ in range(_SHARD_COUNT)]
+        
+        # Serializes cross-shard work (per-user limits, statistics, security state).
+        # Taken before any shard lock, never while holding one.
+        self.session_lock = _RLock()
+        self._tls = threading.local()  # .cache: token -> (SessionData, cached_until)
         
         # Configuration
         self.session_expire_hours = 24
         self.max_sessions_per_user = 5
         self.cleanup_interval = 300  # 5 minutes
         self.session_timeout_minutes = 60  # Auto-logout after inactivity
+        self._expire_seconds = self.session_expire_hours * 3600
+        self._timeout_seconds = self.session_timeout_minutes * 60
         
         # Cleanup management
         self.cleanup_thread: Optional[threading.Thread] = None
         self.is_running = False
+        self._wake = threading.Event()  # Set to run cleanup early or to stop
+        self._next_wake_at = 0.0  # When the cleanup loop is next due to run
         
         # Statistics
         self.stats = {
             "total_sessions_created": 0,
             "total_sessions_expired": 0,
             "total_sessions_cleaned": 0,
-            "active_sessions": 0,
             "validation_failures": 0,
             "cleanup_runs": 0
         }
         
-        # Suspicious activity tracking
-        self.failed_attempts: Dict[str, List[float]] = {}
+        # Suspicious activity tracking (time.monotonic() timestamps, oldest first)
+        self.failed_attempts: Dict[str, Deque[float]] = {}
         self.blocked_ips: Set[str] = set()
+        # Min-heap of (unblock_at, ip); a block is re-queued when newer attempts extend it
+        self._unblock_heap: List[Tuple[float, str]] = []
         self.max_failed_attempts = 5
         self.block_duration = 300  # 5 minutes
         
@@ -89,6 +191,7 @@ class SessionManager:
     def stop_cleanup_service(self):
         """Stop automatic session cleanup service"""
         self.is_running = False
+        self._wake.set()
         if self.cleanup_thread:
             self.cleanup_thread.join(timeout=5.0)
         print("🧹 Session cleanup service stopped")
@@ -97,13 +200,33 @@ class SessionManager:
         """Main cleanup loop"""
         while self.is_running:
             try:
+                self._wake.clear()
                 self._cleanup_expired_sessions()
                 self._cleanup_blocked_ips()
                 self._cleanup_failed_attempts()
-                time.sleep(self.cleanup_interval)
+                self._wake.wait(timeout=self._time_to_next_expiry())
             except Exception as e:
                 print(f"❌ Session cleanup error: {e}")
-                time.sleep(60)  # Longer sleep on error
+                self._wake.wait(timeout=60)  # Longer wait on error
+    
+    def _time_to_next_expiry(self) -> float:
+        """Seconds until the earliest session or IP block deadline, at most cleanup_interval"""
+        now = time.monotonic()
+        next_due = now + self.cleanup_interval
+        
+        # Heap heads are peeked without locks; a stale head only wakes the loop early
+        for heap in [shard.expiry_heap for shard in self._shards] + [self._unblock_heap]:
+            head = heap[:1]
+            if head and head[0][0] < next_due:
+                next_due = head[0][0]
+        
+        self._next_wake_at = next_due
+        return max(next_due - now, _CLEANUP_MIN_WAIT)
+    
+    def _schedule_wake(self, deadline: float):
+        """Wake the cleanup loop early if a deadline falls before its next run"""
+        if deadline < self._next_wake_at:
+            self._wake.set()
     
     def generate_session_token(self) -> str:
         """Generate a cryptographically secure session token"""
@@ -132,31 +255,41 @@ class SessionManager:
             self._cleanup_user_sessions(user_id)
             
             # Check session limits
-            user_sessions = [s for s in self.sessions.values() if s.user_id == user_id and s.is_active]
+            user_sessions = []
+            for shard in self._shards:
+                with shard.lock.read():
+                    user_sessions.extend(shard.sessions[t] for t in shard.by_user.get(user_id, ()))
             if len(user_sessions) >= self.max_sessions_per_user:
                 # Remove oldest session
                 oldest_session = min(user_sessions, key=lambda x: x.last_access)
-                self._remove_session_by_data(oldest_session)
+                shard = self._shard_for(oldest_session.token)
+                with shard.lock.write():
+                    self._remove_session(shard, oldest_session.token)
                 print(f"🔄 Removed oldest session for user: {user_id}")
             
             # Create new session
             token = self.generate_session_token()
-            expiry = datetime.now() + timedelta(hours=self.session_expire_hours)
+            now = time.monotonic()
             
             session_data = SessionData(
                 user_id=user_id,
-                created=datetime.now(),
-                expires=expiry,
-                last_access=datetime.now(),
+                token=token,
+                created=now,
+                expires=now + self._expire_seconds,
+                last_access=now,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                access_count=1,
-                is_active=True
+                access_count=1
             )
             
-            self.sessions[token] = session_data
+            shard = self._shard_for(token)
+            with shard.lock.write():
+                shard.sessions[token] = session_data
+                shard.by_user.setdefault(user_id, set()).add(token)
+                shard.active_count += 1
+                self._index_session(shard, token, session_data)
+            self._schedule_wake(session_data.index_deadline)
             self.stats["total_sessions_created"] += 1
-            self.stats["active_sessions"] = len([s for s in self.sessions.values() if s.is_active])
             
             print(f"✅ Session created for user: {user_id} (token: {token[:8]}...)")
             return token
@@ -175,48 +308,91 @@ class SessionManager:
         if not token:
             return None
         
-        with self.session_lock:
-            session_data = self.sessions.get(token)
-            
-            if not session_data:
+        shard = self._shard_for(token)
+        
+        # Cached path: validated by this thread within the last second and still
+        # stored (not invalidated), with no IP mismatch to report
+        cache = getattr(self._tls, "cache", None)
+        if cache is None:
+            cache = self._tls.cache = {}
+        hit = cache.get(token)
+        if hit is not None and hit[1] > time.monotonic():
+            session_data = hit[0]
+            if (shard.sessions.get(token) is session_data and
+                    not (ip_address and session_data.ip_address and ip_address != session_data.ip_address)):
+                return session_data
+        
+        # Fast path: a live session only needs its shard's shared lock
+        with shard.lock.read():
+            session_data = shard.sessions.get(token)
+            if session_data is not None:
+                now = time.monotonic()
+                if now <= session_data.expires and session_data.last_access >= now - self._timeout_seconds:
+                    if ip_address and session_data.ip_address and ip_address != session_data.ip_address:
+                        print(f"⚠️ IP address mismatch for session: {token[:8]}...")
+                    
+                    # Concurrent validations of one token may race on these;
+                    # they only feed monitoring
+                    session_data.last_access = now
+                    session_data.access_count += 1
+                    self._cache_validation(cache, token, session_data, now)
+                    return session_data
+        
+        # Unknown token: nothing to remove, so the shard is never locked exclusively
+        if session_data is None:
+            with self.session_lock:
                 self.stats["validation_failures"] += 1
-                return None
+            return None
+        
+        # Slow path: expired, re-check and remove exclusively
+        expired = False
+        with shard.lock.write():
+            session_data = shard.sessions.get(token)
+            now = time.monotonic()
+            inactivity_cutoff = now - self._timeout_seconds
             
-            # Check if session is active
-            if not session_data.is_active:
-                self._remove_session(token)
-                self.stats["validation_failures"] += 1
-                return None
+            if not session_data:
+                pass  # Removed since the shared check
             
             # Check expiration
-            now = datetime.now()
-            if now > session_data.expires:
-                self._remove_session(token)
-                self.stats["validation_failures"] += 1
-                self.stats["total_sessions_expired"] += 1
-                return None
+            elif now > session_data.expires:
+                self._remove_session(shard, token)
+                expired = True
             
             # Check session timeout (inactivity)
-            time_since_access = now - session_data.last_access
-            if time_since_access > timedelta(minutes=self.session_timeout_minutes):
-                self._remove_session(token)
-                self.stats["validation_failures"] += 1
-                self.stats["total_sessions_expired"] += 1
+            elif session_data.last_access < inactivity_cutoff:
+                self._remove_session(shard, token)
+                expired = True
                 print(f"⏰ Session expired due to inactivity: {token[:8]}...")
-                return None
-            
-            # IP validation (optional but recommended)
-            if ip_address and session_data.ip_address:
-                if ip_address != session_data.ip_address:
-                    print(f"⚠️ IP address mismatch for session: {token[:8]}...")
-                    # Don't immediately invalidate - could be legitimate IP change
-                    # But log for security monitoring
             
-            # Update last access
-            session_data.last_access = now
-            session_data.access_count += 1
-            
-            return session_data
+            else:
+                # IP validation (optional but recommended)
+                if ip_address and session_data.ip_address:
+                    if ip_address != session_data.ip_address:
+                        print(f"⚠️ IP address mismatch for session: {token[:8]}...")
+                        # Don't immediately invalidate - could be legitimate IP change
+                        # But log for security monitoring
+                
+                # Update last access
+                session_data.last_access = now
+                session_data.access_count += 1
+                
+                self._cache_validation(cache, token, session_data, now)
+                return session_data
+        
+        # Statistics are global, so they are counted after the shard lock is released
+        with self.session_lock:
+            self.stats["validation_failures"] += 1
+            if expired:
+                self.stats["total_sessions_expired"] += 1
+        return None
+    
+    def _cache_validation(self, cache: Dict[str, Tuple[SessionData, float]], token: str,
+                          session_data: SessionData, now: float):
+        """Remember a successful validation in this thread's cache"""
+        if len(cache) >= _VALIDATION_CACHE_MAX:
+            cache.clear()
+        cache[token] = (session_data, min(session_data.expires, now + _VALIDATION_CACHE_TTL))
     
     def invalidate_session(self, token: str) -> bool:
         """
@@ -228,9 +404,10 @@ class SessionManager:
         Returns:
             bool: True if session was invalidated
         """
-        with self.session_lock:
-            if token in self.sessions:
-                self._remove_session(token)
+        shard = self._shard_for(token)
+        with shard.lock.write():
+            if token in shard.sessions:
+                self._remove_session(shard, token)
                 print(f"🚫 Session invalidated: {token[:8]}...")
                 return True
             return False
@@ -247,14 +424,11 @@ class SessionManager:
         """
         count = 0
         with self.session_lock:
-            tokens_to_remove = [
-                token for token, session in self.sessions.items()
-                if session.user_id == user_id
-            ]
-            
-            for token in tokens_to_remove:
-                self._remove_session(token)
-                count += 1
+            for shard in self._shards:
+                with shard.lock.write():
+                    for token in list(shard.by_user.get(user_id, ())):
+                        self._remove_session(shard, token)
+                        count += 1
         
         print(f"🚫 Invalidated {count} sessions for user: {user_id}")
         return count
@@ -273,10 +447,16 @@ class SessionManager:
         if not hours:
             hours = self.session_expire_hours
         
-        with self.session_lock:
-            session_data = self.sessions.get(token)
-            if session_data and session_data.is_active:
-                session_data.expires = datetime.now() + timedelta(hours=hours)
+        shard = self._shard_for(token)
+        with shard.lock.write():
+            session_data = shard.sessions.get(token)
+            if session_data:
+                session_data.expires = time.monotonic() + hours * 3600
+                
+                # A later deadline is picked up lazily, an earlier one needs a new entry
+                if self._session_deadline(session_data) < session_data.index_deadline:
+                    self._index_session(shard, token, session_data)
+                    self._schedule_wake(session_data.index_deadline)
                 print(f"⏰ Session extended: {token[:8]}... (+{hours}h)")
                 return True
             return False
@@ -291,23 +471,23 @@ class SessionManager:
         if not ip_address:
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Initialize or clean old attempts
-        if ip_address not in self.failed_attempts:
-            self.failed_attempts[ip_address] = []
+        attempts = self.failed_attempts.setdefault(ip_address, deque(maxlen=self.max_failed_attempts))
         
         # Remove attempts older than block duration
-        self.failed_attempts[ip_address] = [
-            attempt_time for attempt_time in self.failed_attempts[ip_address]
-            if current_time - attempt_time < self.block_duration
-        ]
+        while attempts and current_time - attempts[0] >= self.block_duration:
+            attempts.popleft()
         
         # Add new attempt
-        self.failed_attempts[ip_address].append(current_time)
+        attempts.append(current_time)
         
         # Check if should block
-        if len(self.failed_attempts[ip_address]) >= self.max_failed_attempts:
+        if len(attempts) >= self.max_failed_attempts:
+            if ip_address not in self.blocked_ips:
+                heapq.heappush(self._unblock_heap, (current_time + self.block_duration, ip_address))
+                self._schedule_wake(current_time + self.block_duration)
             self.blocked_ips.add(ip_address)
             print(f"🚫 IP blocked due to failed attempts: {ip_address}")
     
@@ -324,77 +504,121 @@ class SessionManager:
             return True
         return False
     
-    def _remove_session(self, token: str):
-        """Remove a session (internal method)"""
-        if token in self.sessions:
-            del self.sessions[token]
-            self.stats["active_sessions"] = len([s for s in self.sessions.values() if s.is_active])
+    def _shard_for(self, token: str) -> _SessionShard:
+        """Shard a token is stored in"""
+        return self._shards[hash(token) & _SHARD_MASK]
     
-    def _remove_session_by_data(self, session_data: SessionData):
-        """Remove a session by its data (internal method)"""
-        token_to_remove = None
-        for token, data in self.sessions.items():
-            if data is session_data:
-                token_to_remove = token
-                break
-        
-        if token_to_remove:
-            self._remove_session(token_to_remove)
+    def _remove_session(self, shard: _SessionShard, token: str):
+        """Remove a session (internal method, shard write lock held)"""
+        session_data = shard.sessions.pop(token, None)
+        if session_data is not None:
+            user_tokens = shard.by_user.get(session_data.user_id)
+            if user_tokens is not None:
+                user_tokens.discard(token)
+                if not user_tokens:
+                    del shard.by_user[session_data.user_id]
+            shard.active_count -= 1
     
     def _cleanup_expired_sessions(self):
         """Clean up expired sessions"""
-        current_time = datetime.now()
-        expired_tokens = []
+        current_time = time.monotonic()
+        inactivity_cutoff = current_time - self._timeout_seconds
+        cleaned = 0
         
-        with self.session_lock:
-            for token, session_data in self.sessions.items():
-                if (current_time > session_data.expires or 
-                    current_time - session_data.last_access > timedelta(minutes=self.session_timeout_minutes)):
-                    expired_tokens.append(token)
+        # Shards are swept one at a time so validation elsewhere is not held up
+        for shard in self._shards:
+            expired_tokens = []
             
-            # Remove expired sessions
-            for token in expired_tokens:
-                self._remove_session(token)
-                self.stats["total_sessions_expired"] += 1
-                self.stats["total_sessions_cleaned"] += 1
+            with shard.lock.write():
+                # Only entries whose indexed deadline has passed need a look
+                heap = shard.expiry_heap
+                while heap and heap[0][0] < current_time:
+                    deadline, token = heapq.heappop(heap)
+                    session_data = shard.sessions.get(token)
+                    if session_data is None or deadline != session_data.index_deadline:
+                        continue  # Removed, or superseded by a newer entry
+                    
+                    if session_data.expires < current_time or session_data.last_access < inactivity_cutoff:
+                        expired_tokens.append(token)
+                    else:
+                        # Accessed or extended since it was indexed
+                        self._index_session(shard, token, session_data)
+                
+                # Drop stale entries once they outnumber live sessions
+                if len(heap) > 2 * len(shard.sessions) + 16:
+                    self._rebuild_expiry_heap(shard)
+                
+                # Remove expired sessions
+                for token in expired_tokens:
+                    self._remove_session(shard, token)
+            
+            cleaned += len(expired_tokens)
         
-        if expired_tokens:
-            print(f"🧹 Cleaned up {len(expired_tokens)} expired sessions")
+        if cleaned:
+            print(f"🧹 Cleaned up {cleaned} expired sessions")
         
-        self.stats["cleanup_runs"] += 1
+        with self.session_lock:
+            self.stats["total_sessions_expired"] += cleaned
+            self.stats["total_sessions_cleaned"] += cleaned
+            self.stats["cleanup_runs"] += 1
+    
+    def _session_deadline(self, session_data: SessionData) -> float:
+        """Time after which a session is expired or timed out for inactivity"""
+        return min(session_data.expires, session_data.last_access + self._timeout_seconds)
+    
+    def _index_session(self, shard: _SessionShard, token: str, session_data: SessionData):
+        """Push a session's current deadline onto its shard's expiry heap (shard lock held)"""
+        session_data.index_deadline = self._session_deadline(session_data)
+        heapq.heappush(shard.expiry_heap, (session_data.index_deadline, token))
+    
+    def _rebuild_expiry_heap(self, shard: _SessionShard):
+        """Rebuild a shard's expiry heap with one entry per live session (shard lock held)"""
+        heap = []
+        for token, session_data in shard.sessions.items():
+            session_data.index_deadline = self._session_deadline(session_data)
+            heap.append((session_data.index_deadline, token))
+        heapq.heapify(heap)
+        shard.expiry_heap = heap
     
     def _cleanup_user_sessions(self, user_id: str):
         """Clean up expired sessions for a specific user"""
-        current_time = datetime.now()
-        expired_tokens = []
-        
-        for token, session_data in self.sessions.items():
-            if (session_data.user_id == user_id and 
-                (current_time > session_data.expires or 
-                 current_time - session_data.last_access > timedelta(minutes=self.session_timeout_minutes))):
-                expired_tokens.append(token)
-        
-        # Remove expired sessions
-        for token in expired_tokens:
-            self._remove_session(token)
+        current_time = time.monotonic()
+        inactivity_cutoff = current_time - self._timeout_seconds
+        
+        for shard in self._shards:
+            with shard.lock.write():
+                expired_tokens = []
+                for token in shard.by_user.get(user_id, ()):
+                    session_data = shard.sessions[token]
+                    if current_time > session_data.expires or session_data.last_access < inactivity_cutoff:
+                        expired_tokens.append(token)
+                
+                # Remove expired sessions
+                for token in expired_tokens:
+                    self._remove_session(shard, token)
     
     def _cleanup_blocked_ips(self):
         """Clean up expired IP blocks"""
-        current_time = time.time()
+        current_time = time.monotonic()
         ips_to_unblock = []
+        requeue = []
         
-        for ip in list(self.blocked_ips):
-            # Check if any recent failed attempts
-            if ip in self.failed_attempts:
-                recent_attempts = [
-                    attempt for attempt in self.failed_attempts[ip]
-                    if current_time - attempt < self.block_duration
-                ]
-                if not recent_attempts:
-                    ips_to_unblock.append(ip)
+        heap = self._unblock_heap
+        while heap and heap[0][0] <= current_time:
+            _, ip = heapq.heappop(heap)
+            if ip not in self.blocked_ips:
+                continue  # Unblocked manually
+            
+            # Check if any recent failed attempts, the newest is last
+            attempts = self.failed_attempts.get(ip)
+            if attempts and current_time - attempts[-1] < self.block_duration:
+                requeue.append((attempts[-1] + self.block_duration, ip))
             else:
                 ips_to_unblock.append(ip)
         
+        for entry in requeue:
+            heapq.heappush(heap, entry)
+        
         # Unblock expired IPs
         for ip in ips_to_unblock:
             self.blocked_ips.discard(ip)
@@ -405,41 +629,37 @@ class SessionManager:
     
     def _cleanup_failed_attempts(self):
         """Clean up old failed attempt records"""
-        current_time = time.time()
+        cutoff = time.monotonic() - self.block_duration
         ips_to_clean = []
         
-        for ip, attempts in self.failed_attempts.items():
+        for ip, attempts in list(self.failed_attempts.items()):
             # Keep only recent attempts
-            recent_attempts = [
-                attempt for attempt in attempts
-                if current_time - attempt < self.block_duration
-            ]
+            while attempts and attempts[0] <= cutoff:
+                attempts.popleft()
             
-            if recent_attempts:
-                self.failed_attempts[ip] = recent_attempts
-            else:
+            if not attempts:
                 ips_to_clean.append(ip)
         
         # Remove IPs with no recent attempts
         for ip in ips_to_clean:
-            del self.failed_attempts[ip]
+            self.failed_attempts.pop(ip, None)
     
     def get_session_stats(self) -> Dict[str, Any]:
         """Get session management statistics"""
+        # Calculate session ages
+        now = time.monotonic()
+        session_ages = []
+        for shard in self._shards:
+            with shard.lock.read():
+                session_ages.extend(
+                    (now - session.created) / 3600  # Hours
+                    for session in shard.sessions.values()
+                )
+        
         with self.session_lock:
-            active_sessions = len([s for s in self.sessions.values() if s.is_active])
-            
-            # Calculate session ages
-            now = datetime.now()
-            session_ages = [
-                (now - session.created).total_seconds() / 3600  # Hours
-                for session in self.sessions.values()
-                if session.is_active
-            ]
-            
             return {
                 **self.stats,
-                "active_sessions": active_sessions,
+                "active_sessions": len(session_ages),
                 "blocked_ips": len(self.blocked_ips),
                 "failed_attempt_ips": len(self.failed_attempts),
                 "average_session_age_hours": sum(session_ages) / len(session_ages) if session_ages else 0,
@@ -456,34 +676,40 @@ class SessionManager:
     
     def get_active_sessions(self) -> List[Dict[str, Any]]:
         """Get list of active sessions (for monitoring)"""
-        with self.session_lock:
-            sessions = []
-            for token, session_data in self.sessions.items():
-                if session_data.is_active:
+        mono_now = time.monotonic()
+        wall_now = datetime.now()
+        sessions = []
+        for shard in self._shards:
+            with shard.lock.read():
+                for token, session_data in shard.sessions.items():
                     sessions.append({
                         "token_prefix": token[:8] + "...",
                         "user_id": session_data.user_id,
-                        "created": session_data.created.isoformat(),
-                        "last_access": session_data.last_access.isoformat(),
+                        "created": monotonic_to_iso(session_data.created, mono_now, wall_now),
+                        "last_access": monotonic_to_iso(session_data.last_access, mono_now, wall_now),
                         "access_count": session_data.access_count,
                         "ip_address": session_data.ip_address,
-                        "expires": session_data.expires.isoformat()
+                        "expires": monotonic_to_iso(session_data.expires, mono_now, wall_now)
                     })
-            return sessions
+        return sessions
+    
+    def get_active_session_count(self) -> int:
+        """Get number of active sessions without building the session list"""
+        return sum(shard.active_count for shard in self._shards)
     
     def force_cleanup(self) -> Dict[str, int]:
         """Force immediate cleanup of all expired resources"""
         print("🧹 Forcing comprehensive session cleanup...")
         
         with self.session_lock:
-            initial_sessions = len(self.sessions)
+            initial_sessions = self.get_active_session_count()
             initial_blocked = len(self.blocked_ips)
             
             self._cleanup_expired_sessions()
             self._cleanup_blocked_ips()
             self._cleanup_failed_attempts()
             
-            final_sessions = len(self.sessions)
+            final_sessions = self.get_active_session_count()
             final_blocked = len(self.blocked_ips)
             
             result = {
@@ -0,0 +1,23 @@
+"""
+Time utilities shared by the camera system modules
+
+Internal state is timestamped with time.monotonic() so it is immune to
+wall-clock changes; these helpers convert it for API responses.
+"""
+
+from datetime import datetime, timedelta
+
+
+def monotonic_to_iso(timestamp: float, mono_now: float, wall_now: datetime) -> str:
+    """
+    Convert a time.monotonic() timestamp to an ISO wall-clock string
+
+    Args:
+        timestamp: time.monotonic() value to convert
+        mono_now: time.monotonic() reading taken together with wall_now
+        wall_now: Wall-clock time corresponding to mono_now
+
+    Returns:
+        str: ISO 8601 wall-clock time of the timestamp
+    """
+    return (wall_now - timedelta(seconds=mono_now - timestamp)).isoformat()
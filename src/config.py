@@ -41,6 +41,7 @@ class AppConfig:
     buffer_count_auto: bool
     buffer_count_fallback: int
     low_resource_mode: bool
+    max_camera_memory_mb: int
     
     # Camera orientation
     camera_hflip: bool
@@ -58,6 +59,7 @@ class AppConfig:
     # Application
     photos_dir: str
     max_photos: int
+    photo_drop_page_cache: bool
 
     @classmethod
     def from_env(cls) -> 'AppConfig':
@@ -118,6 +120,7 @@ class AppConfig:
             buffer_count_auto=get_bool('BUFFER_COUNT_AUTO', True),
             buffer_count_fallback=get_int('BUFFER_COUNT_FALLBACK', 2),
             low_resource_mode=get_bool('LOW_RESOURCE_MODE', False),
+            max_camera_memory_mb=get_int('MAX_CAMERA_MEMORY_MB', 128),
             
             # Camera orientation
             camera_hflip=get_bool('CAMERA_HFLIP', True),
@@ -134,7 +137,8 @@ class AppConfig:
             
             # Application settings
             photos_dir=get_str('PHOTOS_DIR', 'captured_images'),
-            max_photos=get_int('MAX_PHOTOS', 100)
+            max_photos=get_int('MAX_PHOTOS', 100),
+            photo_drop_page_cache=get_bool('PHOTO_DROP_PAGE_CACHE', False)
         )
     
     def validate(self) -> list[str]:
@@ -155,6 +159,9 @@ class AppConfig:
         if self.stream_width < 160 or self.stream_height < 120:
             errors.append("Stream resolution too small (minimum 160x120)")
         
+        if self.max_camera_memory_mb < 16:
+            errors.append(f"Invalid max camera memory: {self.max_camera_memory_mb}MB (minimum 16MB)")
+        
         # Validate server settings
         if not (1 <= self.port <= 65535):
             errors.append("Port must be between 1 and 65535")
@@ -184,10 +191,10 @@ class AppConfig:
         print(f"   🎥 Stream: {self.stream_width}x{self.stream_height}, Quality={self.stream_quality}")
         print(f"   🔄 Adaptive: Streaming={self.adaptive_streaming}, Quality={self.adaptive_quality}")
         print(f"   📊 Frame Rate: {self.min_frame_rate}-{self.max_frame_rate} fps, Quality: {self.min_stream_quality}-{self.stream_quality}%")
-        print(f"   🧠 Memory: Auto-buffer={self.buffer_count_auto}, Fallback={self.buffer_count_fallback}, Low-resource={self.low_resource_mode}")
+        print(f"   🧠 Memory: Auto-buffer={self.buffer_count_auto}, Fallback={self.buffer_count_fallback}, Low-resource={self.low_resource_mode}, Budget={self.max_camera_memory_mb}MB")
         print(f"   🔄 Transform: HFlip={self.camera_hflip}, VFlip={self.camera_vflip}")
         print(f"   🌐 Server: {self.host}:{self.port}, Debug={self.debug}")
-        print(f"   📁 Photos: {self.photos_dir}, Max={self.max_photos}")
+        print(f"   📁 Photos: {self.photos_dir}, Max={self.max_photos}, Drop page cache={self.photo_drop_page_cache}")
 
 
 def generate_secure_credentials() -> tuple[str, str]:
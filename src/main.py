@@ -3,24 +3,39 @@ Raspberry Pi Camera Web Application - Enhanced with Health Monitoring and Auto-R
 FastAPI-based web app for camera streaming and photo capture with comprehensive health monitoring
 """
 
+import asyncio
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
-from fastapi import FastAPI, HTTPException, Request, Depends, Query, Cookie
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Request, Depends, Query, Cookie, Header
+from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
+# Route module loggers to stdout (like print) before the camera modules are imported.
+# Records are queued and written by a listener thread, so camera and recovery
+# threads never block on stdout.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 from src.config import get_config, AppConfig
 from src.camera import CameraManager
 from src.camera.session_manager import SessionManager
 from src.camera.health_monitor import HealthMonitor
 from src.camera.recovery_manager import RecoveryManager
 from src.camera.streaming_validator import StreamingValidator
-from src.camera.health_api import HealthAPI
+from src.camera.health_api import HealthAPI, request_timestamp
 
 # Initialize configuration
 config = get_config()
@@ -30,7 +45,8 @@ config.print_summary()
 app = FastAPI(
     title="Raspberry Pi Camera Web App - Enhanced",
     description="Secure camera streaming and photo capture system with health monitoring and auto-recovery",
-    version="2.1.0"
+    version="2.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Security scheme
@@ -205,6 +221,10 @@ async def shutdown_event():
         if health_monitor:
             health_monitor.stop_monitoring()
         
+        # Stop recovery, letting a running recovery finish before the camera is released
+        if recovery_manager:
+            recovery_manager.shutdown()
+        
         # Stop session cleanup
         if session_manager:
             session_manager.stop_cleanup_service()
@@ -340,111 +360,149 @@ async def health_check():
 # Enhanced Health API Endpoints
 
 @app.get("/api/health/detailed")
-async def get_detailed_health(api_key: str = Depends(verify_api_key)):
+async def get_detailed_health(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Get comprehensive system health status"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_health_detailed()
+    return await health_api.get_health_detailed(timestamp=timestamp)
 
 
 @app.get("/api/health/camera")
-async def get_camera_health(api_key: str = Depends(verify_api_key)):
+async def get_camera_health(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Get camera-specific health information"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_health_camera()
+    return health_api.get_health_camera(timestamp=timestamp)
 
 
 @app.get("/api/health/streaming")
-async def get_streaming_health(api_key: str = Depends(verify_api_key)):
+async def get_streaming_health(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Get streaming-specific health and performance information"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_health_streaming()
+    return health_api.get_health_streaming(timestamp=timestamp)
 
 
 @app.get("/api/health/sessions")
-async def get_session_health(api_key: str = Depends(verify_api_key)):
+async def get_session_health(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Get session management health information"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_health_sessions()
+    return health_api.get_health_sessions(timestamp=timestamp)
 
 
 @app.get("/api/health/recovery")
-async def get_recovery_health(api_key: str = Depends(verify_api_key)):
+async def get_recovery_health(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Get recovery system status and history"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_health_recovery()
+    return health_api.get_health_recovery(timestamp=timestamp)
 
 
 @app.get("/api/diagnostics/comprehensive")
-async def get_comprehensive_diagnostics(api_key: str = Depends(verify_api_key)):
+async def get_comprehensive_diagnostics(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp),
+    if_none_match: Optional[str] = Header(None)
+):
     """Get comprehensive system diagnostics"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_diagnostics_comprehensive()
+    return await health_api.get_diagnostics_comprehensive(timestamp=timestamp, if_none_match=if_none_match)
 
 
 @app.get("/api/diagnostics/performance")
-async def get_performance_diagnostics(api_key: str = Depends(verify_api_key)):
+async def get_performance_diagnostics(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Get performance-specific diagnostics"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.get_diagnostics_performance()
+    return health_api.get_diagnostics_performance(timestamp=timestamp)
 
 
 @app.post("/api/health/check/force")
-async def force_health_check(api_key: str = Depends(verify_api_key)):
+async def force_health_check(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Force an immediate comprehensive health check"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.force_health_check()
+    return health_api.force_health_check(timestamp=timestamp)
 
 
 @app.post("/api/recovery/trigger/{problem_type}")
-async def trigger_recovery(problem_type: str, api_key: str = Depends(verify_api_key)):
+async def trigger_recovery(
+    problem_type: str,
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Trigger recovery for a specific problem type"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.trigger_recovery(problem_type)
+    return health_api.trigger_recovery(problem_type, timestamp=timestamp)
 
 
 @app.post("/api/system/reset")
-async def reset_system_state(api_key: str = Depends(verify_api_key)):
+async def reset_system_state(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Reset all system monitoring and recovery state"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.reset_system_state()
+    return health_api.reset_system_state(timestamp=timestamp)
 
 
 @app.get("/api/streaming/quality/validate")
-async def validate_stream_quality(api_key: str = Depends(verify_api_key)):
+async def validate_stream_quality(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Validate current stream quality with recommendations"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.validate_stream_quality()
+    return health_api.validate_stream_quality(timestamp=timestamp)
 
 
 @app.get("/api/streaming/frozen-frames/detect")
-async def detect_frozen_frames(api_key: str = Depends(verify_api_key)):
+async def detect_frozen_frames(
+    api_key: str = Depends(verify_api_key),
+    timestamp: datetime = Depends(request_timestamp)
+):
     """Check for frozen or stale frames"""
     if not health_api:
         raise HTTPException(status_code=503, detail="Health API not available")
     
-    return health_api.detect_frozen_frames()
+    return health_api.detect_frozen_frames(timestamp=timestamp)
 
 
 # Original API endpoints (enhanced with better error handling)
@@ -475,7 +533,8 @@ async def capture_photo(api_key: str = Depends(verify_api_key)):
         raise HTTPException(status_code=500, detail="Camera manager not available")
     
     try:
-        success, message, filename = camera_manager.capture_photo()
+        # Runs off the event loop; returns once the photo is written
+        success, message, filename = await asyncio.to_thread(camera_manager.capture_photo)
         
         if success:
             # Get file info
@@ -669,7 +728,8 @@ async def session_capture_photo(session = Depends(verify_session)):
         raise HTTPException(status_code=500, detail="Camera manager not available")
     
     try:
-        success, message, filename = camera_manager.capture_photo()
+        # Runs off the event loop; returns once the photo is written
+        success, message, filename = await asyncio.to_thread(camera_manager.capture_photo)
         
         if success:
             filepath = os.path.join(config.photos_dir, filename)